@@ -2,11 +2,11 @@
 
 import logging
 import sqlite3
+import threading
 
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Optional
-from ..utils.structs import DictEntry
+from typing import Any, List, Dict, Optional, Set, Tuple
+from ..utils.structs import DictEntry, LRUCache
 
 
 logger = logging.getLogger(__name__)
@@ -16,34 +16,44 @@ class BookmarksDB:
     """Manage dictionary entry bookmarks with SQLite."""
 
     class BookmarkEntry(DictEntry):
+        __slots__ = ("_created_at", "_row_id")
+
         def __init__(self,
             dict_id: str,
             dict_name: str,
             term_id: int,
             term: str,
-            created_at: str
+            created_at: str,
+            row_id: Optional[int] = None
         ):
             super().__init__(dict_id, dict_name, term_id, term)
             self._created_at = created_at
+            self._row_id = row_id
 
         @property
         def created_at(self) -> str:
             return self._created_at
 
+        @property
+        def page_key(self) -> Tuple[str, Optional[int]]:
+            """Position of the entry, to fetch the entries that follow it."""
+            return (self._created_at, self._row_id)
+
         def created_at_formatted(self) -> str:
             """Format ISO timestamp for display."""
-            try:
-                # Parse ISO format or SQLite format
-                dt = datetime.fromisoformat(self.created_at.replace('Z', '+00:00'))
-                return dt.strftime("%Y-%m-%d %H:%M:%S")
-            except:
-                try:
-                    # Try SQLite format
-                    dt = datetime.strptime(self.created_at, "%Y-%m-%d %H:%M:%S")
-                    return dt.strftime("%Y-%m-%d %H:%M:%S")
-                except:
-                    return self.created_at
+            from ..utils.utils import format_timestamp
+            return format_timestamp(self.created_at)
+
+
+    # Bookmarked (key_id, source) pairs, loaded on first check. Shared by all
+    # instances since they use the same database file.
+    _bookmarked_keys: Optional[Set[Tuple[str, str]]] = None
+    _keys_lock = threading.Lock()
+
+    # Number of get_bookmarks() results kept for repeated filter queries
+    QUERY_CACHE_SIZE = 64
 
+    _query_cache: "LRUCache[tuple, List[BookmarkEntry]]" = LRUCache(QUERY_CACHE_SIZE)
 
     def __init__(self) -> None:
         """Initialize bookmarks database."""
@@ -73,7 +83,10 @@ class BookmarksDB:
         logger.debug(f"✓ Bookmarks database initialized at {self.db_path}")
 
     def add_bookmark(self, entry: DictEntry) -> bool:
-        """Add entry to bookmarks. Returns True if added, False if already exists."""
+        """Add entry to bookmarks. Returns True if added, False if already exists.
+
+        Callers update the bookmark state first with update_cached_key.
+        """
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.execute(
@@ -81,6 +94,7 @@ class BookmarksDB:
                     (str(entry.term_id), entry.term, entry.dict_id, entry.dict_name)
                 )
                 conn.commit()
+                self._invalidate_queries()
                 return cursor.rowcount > 0
         except sqlite3.IntegrityError:
             # Already bookmarked
@@ -90,7 +104,10 @@ class BookmarksDB:
             return False
 
     def remove_bookmark(self, entry: DictEntry) -> bool:
-        """Remove entry from bookmarks. Returns True if removed."""
+        """Remove entry from bookmarks. Returns True if removed.
+
+        Callers update the bookmark state first with update_cached_key.
+        """
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.execute(
@@ -98,6 +115,7 @@ class BookmarksDB:
                     (str(entry.term_id), entry.dict_id)
                 )
                 conn.commit()
+                self._invalidate_queries()
                 return cursor.rowcount > 0
         except Exception as e:
             logger.warning(f"✗ Failed to remove bookmark: {e}")
@@ -105,61 +123,109 @@ class BookmarksDB:
 
     def is_bookmarked(self, entry: DictEntry) -> bool:
         """Check if entry is bookmarked."""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    "SELECT 1 FROM bookmarks WHERE key_id = ? AND source = ?",
-                    (str(entry.term_id), entry.dict_id)
-                )
-                return cursor.fetchone() is not None
-        except Exception as e:
-            logger.warning(f"✗ Failed to check bookmark: {e}")
-            return False
+        with BookmarksDB._keys_lock:
+            if BookmarksDB._bookmarked_keys is None:
+                try:
+                    with sqlite3.connect(self.db_path) as conn:
+                        cursor = conn.execute("SELECT key_id, source FROM bookmarks")
+                        BookmarksDB._bookmarked_keys = {(row[0], row[1]) for row in cursor}
+                except Exception as e:
+                    logger.warning(f"✗ Failed to check bookmark: {e}")
+                    return False
+            return (str(entry.term_id), entry.dict_id) in BookmarksDB._bookmarked_keys
+
+    def update_cached_key(self, entry: DictEntry, bookmarked: bool) -> None:
+        """Keep the loaded bookmark keys in sync with a change, ahead of writing it."""
+        with BookmarksDB._keys_lock:
+            if BookmarksDB._bookmarked_keys is None:
+                return
+            key = (str(entry.term_id), entry.dict_id)
+            if bookmarked:
+                BookmarksDB._bookmarked_keys.add(key)
+            else:
+                BookmarksDB._bookmarked_keys.discard(key)
+
+    def get_bookmarks(self,
+        filter_query: str = "",
+        limit: int = 1000,
+        after: Optional[Tuple[str, Optional[int]]] = None
+    ) -> List[BookmarkEntry]:
+        """
+        Get bookmarks, newest first, optionally filtered.
+        
+        Args:
+            filter_query: Text to look for in the key or dictionary name
+            limit: Maximum number of entries to return
+            after: page_key of the last entry of the previous page
+        """
+        cache_key = (filter_query, limit, after)
+        cached = BookmarksDB._query_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
 
-    def get_bookmarks(self, filter_query: str = "", limit: int = 1000) -> List[BookmarkEntry]:
-        """Get bookmarks, optionally filtered."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                
-                if filter_query:
-                    query_lower = f"%{filter_query.lower()}%"
-                    cursor = conn.execute("""
-                        SELECT key_id, key, source, dictionary, created_at FROM bookmarks
-                        WHERE LOWER(key) LIKE ? OR LOWER(dictionary) LIKE ?
-                        ORDER BY created_at DESC
-                        LIMIT ?
-                    """, (query_lower, query_lower, limit))
-                else:
-                    cursor = conn.execute("""
-                        SELECT key_id, key, source, dictionary, created_at FROM bookmarks
-                        ORDER BY created_at DESC
-                        LIMIT ?
-                    """, (limit,))
-                
-                rows = []
-                for row in cursor.fetchall():
-                    rows.append(self.BookmarkEntry(
-                        term_id=row[0],
-                        term=row[1],
-                        dict_id=row[2],
-                        dict_name=row[3],
-                        created_at=row[4]
-                    ))
-                return rows
+            rows = self._query_bookmarks(filter_query, limit, after)
         except Exception as e:
             logger.warning(f"✗ Failed to get bookmarks: {e}")
             return []
 
+        BookmarksDB._query_cache.put(cache_key, rows)
+        return list(rows)
+
+    def _invalidate_queries(self) -> None:
+        """Forget cached query results after the bookmarks changed."""
+        BookmarksDB._query_cache.clear()
+
+    def _query_bookmarks(self,
+        filter_query: str,
+        limit: int,
+        after: Optional[Tuple[str, Optional[int]]]
+    ) -> List[BookmarkEntry]:
+        """Run the bookmarks query behind get_bookmarks()."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            conditions: List[str] = []
+            params: List[Any] = []
+
+            if filter_query:
+                query_lower = f"%{filter_query.lower()}%"
+                conditions.append("(LOWER(key) LIKE ? OR LOWER(dictionary) LIKE ?)")
+                params.extend((query_lower, query_lower))
+
+            if after:
+                # Keyset pagination: continue below the last entry shown
+                conditions.append("(created_at, id) < (?, ?)")
+                params.extend(after)
+
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            cursor = conn.execute(f"""
+                SELECT id, key_id, key, source, dictionary, created_at FROM bookmarks
+                {where}
+                ORDER BY created_at DESC, id DESC
+                LIMIT ?
+            """, (*params, limit))
+            
+            rows = []
+            for row in cursor.fetchall():
+                rows.append(self.BookmarkEntry(
+                    term_id=int(row[1]),  # key_id is stored as TEXT
+                    term=row[2],
+                    dict_id=row[3],
+                    dict_name=row[4],
+                    created_at=row[5],
+                    row_id=row[0]
+                ))
+            return rows
+
     def clear_bookmarks(self) -> None:
-        """Clear all bookmarks."""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("DELETE FROM bookmarks")
-                conn.commit()
-            logger.debug("✓ Bookmarks cleared")
-        except Exception as e:
-            logger.warning(f"✗ Failed to clear bookmarks: {e}")
+        """Clear all bookmarks. Errors are raised for the caller to report."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM bookmarks")
+            conn.commit()
+        with BookmarksDB._keys_lock:
+            BookmarksDB._bookmarked_keys = set()
+        self._invalidate_queries()
+        logger.debug("✓ Bookmarks cleared")
 
     def get_count(self) -> int:
         """Get total number of bookmarks."""
@@ -4,9 +4,8 @@ import logging
 import sqlite3
 
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Optional
-from ..utils.structs import DictEntry
+from typing import Any, List, Dict, Optional, Tuple
+from ..utils.structs import DictEntry, LRUCache
 
 
 logger = logging.getLogger(__name__)
@@ -16,41 +15,48 @@ class HistoryDB:
     """Manage dictionary lookup history with SQLite."""
 
     class HistoryEntry(DictEntry):
+        __slots__ = ("_created_at", "_row_id")
+
         def __init__(self,
             dict_id: str,
             dict_name: str,
             term_id: int,
             term: str,
-            created_at: str
+            created_at: str,
+            row_id: Optional[int] = None
         ):
             super().__init__(dict_id, dict_name, term_id, term)
             self._created_at = created_at
+            self._row_id = row_id
 
         @property
         def created_at(self) -> str:
             return self._created_at
 
+        @property
+        def page_key(self) -> Tuple[str, Optional[int]]:
+            """Position of the entry, to fetch the entries that follow it."""
+            return (self._created_at, self._row_id)
+
         def created_at_formatted(self) -> str:
             """Format ISO timestamp for display."""
-            try:
-                # Parse ISO format or SQLite format
-                dt = datetime.fromisoformat(self.created_at.replace('Z', '+00:00'))
-                return dt.strftime("%Y-%m-%d %H:%M:%S")
-            except:
-                try:
-                    # Try SQLite format
-                    dt = datetime.strptime(self.created_at, "%Y-%m-%d %H:%M:%S")
-                    return dt.strftime("%Y-%m-%d %H:%M:%S")
-                except:
-                    return self.created_at
+            from ..utils.utils import format_timestamp
+            return format_timestamp(self.created_at)
 
 
+    # Number of get_history() results kept for repeated filter queries
+    QUERY_CACHE_SIZE = 64
+
+    # Shared by all instances since they use the same database file
+    _query_cache: "LRUCache[tuple, List[HistoryEntry]]" = LRUCache(QUERY_CACHE_SIZE)
+
     def __init__(self) -> None:
         """Initialize history database."""
         from ..utils.utils import get_config_dir
         self.config_dir = get_config_dir()
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.db_path = self.config_dir / "history.db"
+        self._fts_available = False  # Whether history_fts can be used for filtering
         self._init_db()
 
     def _init_db(self) -> None:
@@ -70,8 +76,41 @@ class HistoryDB:
             # Index for faster lookups
             conn.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON history(timestamp DESC)")
             conn.commit()
+            self._init_fts(conn)
         logger.debug(f"✓ History database initialized at {self.db_path}")
 
+    def _init_fts(self, conn: sqlite3.Connection) -> None:
+        """Initialize the full-text index used for filtering history."""
+        try:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'history_fts'"
+            ).fetchone() is not None
+            # Trigram tokens allow case-insensitive substring matches like LIKE
+            conn.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5(
+                    key, dictionary, content='history', content_rowid='id', tokenize='trigram'
+                );
+                CREATE TRIGGER IF NOT EXISTS history_fts_ai AFTER INSERT ON history BEGIN
+                    INSERT INTO history_fts(rowid, key, dictionary) VALUES (new.id, new.key, new.dictionary);
+                END;
+                CREATE TRIGGER IF NOT EXISTS history_fts_ad AFTER DELETE ON history BEGIN
+                    INSERT INTO history_fts(history_fts, rowid, key, dictionary) VALUES ('delete', old.id, old.key, old.dictionary);
+                END;
+                CREATE TRIGGER IF NOT EXISTS history_fts_au AFTER UPDATE OF key, dictionary ON history BEGIN
+                    INSERT INTO history_fts(history_fts, rowid, key, dictionary) VALUES ('delete', old.id, old.key, old.dictionary);
+                    INSERT INTO history_fts(rowid, key, dictionary) VALUES (new.id, new.key, new.dictionary);
+                END;
+            """)
+            if not exists:
+                # Index the entries recorded before the index existed
+                conn.execute("INSERT INTO history_fts(history_fts) VALUES ('rebuild')")
+            conn.commit()
+            self._fts_available = True
+        except sqlite3.OperationalError as e:
+            # SQLite without FTS5 or the trigram tokenizer
+            logger.debug(f"History full-text index unavailable: {e}")
+            self._fts_available = False
+
     def add_entry(self, entry: DictEntry) -> None:
         """Add entry to history or update timestamp if duplicate."""
         try:
@@ -93,6 +132,7 @@ class HistoryDB:
                 
                 # Cleanup old entries (keep only 500)
                 self._cleanup_old_entries()
+                self._invalidate_queries()
         except Exception as e:
             logger.warning(f"✗ Failed to add history entry: {e}")
 
@@ -118,50 +158,89 @@ class HistoryDB:
         except Exception as e:
             logger.warning(f"✗ Failed to cleanup history: {e}")
 
-    def get_history(self, filter_query: str = "", limit: int = 500) -> List[HistoryEntry]:
-        """Get history items, optionally filtered."""
+    def get_history(self,
+        filter_query: str = "",
+        limit: int = 500,
+        after: Optional[Tuple[str, Optional[int]]] = None
+    ) -> List[HistoryEntry]:
+        """
+        Get history items, newest first, optionally filtered.
+        
+        Args:
+            filter_query: Text to look for in the key or dictionary name
+            limit: Maximum number of entries to return
+            after: page_key of the last entry of the previous page
+        """
+        cache_key = (filter_query, limit, after)
+        cached = HistoryDB._query_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                
-                if filter_query:
-                    query_lower = f"%{filter_query.lower()}%"
-                    cursor = conn.execute("""
-                        SELECT key_id, key, source, dictionary, timestamp FROM history
-                        WHERE LOWER(key) LIKE ? OR LOWER(dictionary) LIKE ?
-                        ORDER BY timestamp DESC
-                        LIMIT ?
-                    """, (query_lower, query_lower, limit))
-                else:
-                    cursor = conn.execute("""
-                        SELECT key_id, key, source, dictionary, timestamp FROM history
-                        ORDER BY timestamp DESC
-                        LIMIT ?
-                    """, (limit,))
-                
-                rows = []
-                for row in cursor.fetchall():
-                    rows.append(self.HistoryEntry(
-                        term_id=row[0],
-                        term=row[1],
-                        dict_id=row[2],
-                        dict_name=row[3],
-                        created_at=row[4]
-                    ))
-                return rows
+            rows = self._query_history(filter_query, limit, after)
         except Exception as e:
             logger.warning(f"✗ Failed to get history: {e}")
             return []
 
+        HistoryDB._query_cache.put(cache_key, rows)
+        return list(rows)
+
+    def _invalidate_queries(self) -> None:
+        """Forget cached query results after the history changed."""
+        HistoryDB._query_cache.clear()
+
+    def _query_history(self,
+        filter_query: str,
+        limit: int,
+        after: Optional[Tuple[str, Optional[int]]]
+    ) -> List[HistoryEntry]:
+        """Run the history query behind get_history()."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            conditions: List[str] = []
+            params: List[Any] = []
+
+            if filter_query and self._fts_available and len(filter_query) >= 3:
+                # Trigram index needs at least three characters
+                conditions.append("id IN (SELECT rowid FROM history_fts WHERE history_fts MATCH ?)")
+                params.append('"' + filter_query.replace('"', '""') + '"')
+            elif filter_query:
+                query_lower = f"%{filter_query.lower()}%"
+                conditions.append("(LOWER(key) LIKE ? OR LOWER(dictionary) LIKE ?)")
+                params.extend((query_lower, query_lower))
+
+            if after:
+                # Keyset pagination: continue below the last entry shown
+                conditions.append("(timestamp, id) < (?, ?)")
+                params.extend(after)
+
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            cursor = conn.execute(f"""
+                SELECT id, key_id, key, source, dictionary, timestamp FROM history
+                {where}
+                ORDER BY timestamp DESC, id DESC
+                LIMIT ?
+            """, (*params, limit))
+            
+            rows = []
+            for row in cursor.fetchall():
+                rows.append(self.HistoryEntry(
+                    term_id=int(row[1]),  # key_id is stored as TEXT
+                    term=row[2],
+                    dict_id=row[3],
+                    dict_name=row[4],
+                    created_at=row[5],
+                    row_id=row[0]
+                ))
+            return rows
+
     def clear_history(self) -> None:
-        """Clear all history."""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("DELETE FROM history")
-                conn.commit()
-            logger.debug("✓ History cleared")
-        except Exception as e:
-            logger.warning(f"✗ Failed to clear history: {e}")
+        """Clear all history. Errors are raised for the caller to report."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM history")
+            conn.commit()
+        self._invalidate_queries()
+        logger.debug("✓ History cleared")
 
     def get_count(self) -> int:
         """Get total number of history entries."""
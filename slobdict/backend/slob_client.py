@@ -1,12 +1,14 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 import logging
+import threading
 
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Dict, Optional, Callable, Tuple
 from .dictionary_manager import DictionaryManager
 from .slob import Slob
-from ..utils.structs import DictEntry, DictEntryContent
+from ..utils.structs import DictEntry, DictEntryContent, LRUCache
 
 
 logger = logging.getLogger(__name__)
@@ -15,6 +17,9 @@ logger = logging.getLogger(__name__)
 class SlobClient:
     """Client for querying slob dictionaries."""
 
+    # Number of (query, limit) search results kept for repeated queries
+    SEARCH_CACHE_SIZE = 256
+
     class DictInfoInner(object):
         def __init__(self, dict_id: str, dict_name: str, slob: Slob):
             self._dict_id = dict_id
@@ -41,6 +46,8 @@ class SlobClient:
         self.dictionaries: Dict[str, SlobClient.DictInfoInner] = {}
         self.current_request_id: int = -1  # Track current request for cancellation
         self.on_dictionaries_changed = on_dictionaries_changed  # Callback for UI updates
+        # Searches run from the UI, the HTTP server and the search provider
+        self._search_cache: LRUCache[Tuple[str, int], List[DictEntry]] = LRUCache(self.SEARCH_CACHE_SIZE)
         self.load_dictionaries()
 
     def load_dictionaries(self) -> None:
@@ -48,6 +55,7 @@ class SlobClient:
         # Clear existing dictionaries
         self.close()
         self.dictionaries = {}
+        self._search_cache.clear()
 
         # Load enabled dictionaries from manager
         for dict_info in self.dict_manager.get_dictionaries():
@@ -103,10 +111,22 @@ class SlobClient:
         Returns:
             True if successful, False otherwise
         """
-        result = self.dict_manager.delete_dictionary(filename)
-        if result:
+        return self.delete_dictionaries([filename])
+
+    def delete_dictionaries(self, filenames: List[str]) -> bool:
+        """
+        Delete several dictionaries and reload once.
+        
+        Args:
+            filenames: Names of the dictionary files
+            
+        Returns:
+            True if all of them were deleted, False otherwise
+        """
+        deleted = [self.dict_manager.delete_dictionary(filename) for filename in filenames]
+        if any(deleted):
             self.load_dictionaries()  # Reload all dictionaries
-        return result
+        return all(deleted)
 
     def set_dictionary_enabled(self, filename: str, enabled: bool) -> bool:
         """
@@ -124,7 +144,12 @@ class SlobClient:
             self.load_dictionaries()  # Reload all dictionaries
         return result
 
-    def search(self, query: str, limit: int = 50, request_id: Optional[int] = None) -> List[DictEntry]:
+    def search(self,
+        query: str,
+        limit: int = 50,
+        request_id: Optional[int] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> List[DictEntry]:
         """
         Search all dictionaries for matching terms.
         
@@ -132,41 +157,73 @@ class SlobClient:
             query: Search query string
             limit: Maximum results to return
             request_id: Request ID for cancellation tracking
+            cancel_event: Event which, once set, aborts the search
         
         Returns:
             List of DictEntry
         """
-        results = []
+        cache_key = (query, limit)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        # Matches are kept as plain (sort key, term, term id, dictionary id,
+        # dictionary name) rows and only the ones within the limit become
+        # DictEntry objects
+        rows: List[Tuple[str, str, int, str, str]] = []
         
         for dict_id, dict_info in self.dictionaries.items():
             # Check if this request has been cancelled
-            if request_id and request_id != self.current_request_id:
+            if self._is_cancelled(request_id, cancel_event):
                 logger.debug(f"Search cancelled (request {request_id})")
                 return []
             
             try:
-                matches = self._find_in_slob(dict_info.slob, query, limit, request_id)
-                for match in matches:
-                    results.append(DictEntry(
-                        dict_id=dict_id,
-                        dict_name=dict_info.name,
-                        term_id=int(match[0]),
-                        term=match[1]
-                    ))
+                matches = self._find_in_slob(dict_info.slob, query, limit, request_id, cancel_event)
+                rows.extend((term.casefold(), term, term_id, dict_id, dict_info.name) for term_id, term in matches)
             except Exception as e:
                 logger.exception(f"Error searching {dict_info.name}")
 
-        results.sort(key=lambda d: d.term.casefold())
-        return results[:limit]
+        # Partial results of an aborted search must not be cached
+        if self._is_cancelled(request_id, cancel_event):
+            return []
 
-    def _find_in_slob(self, slob: Slob, query: str, limit: int, request_id: Optional[int] = None) -> List[Tuple[int, str]]:
+        rows.sort(key=itemgetter(0))
+        results = [
+            DictEntry(dict_id=dict_id, dict_name=dict_name, term_id=int(term_id), term=term)
+            for _, term, term_id, dict_id, dict_name in rows[:limit]
+        ]
+        self._search_cache.put(cache_key, results)
+        return list(results)
+
+    def get_cached_search(self, query: str, limit: int = 50) -> Optional[List[DictEntry]]:
+        """
+        Return the results of an earlier search without searching again.
+        
+        Args:
+            query: Search query string
+            limit: Maximum results to return
+        
+        Returns:
+            List of DictEntry, or None if the search is not cached
+        """
+        cached = self._search_cache.get((query, limit))
+        return list(cached) if cached is not None else None
+
+    def _find_in_slob(self,
+        slob: Slob,
+        query: str,
+        limit: int,
+        request_id: Optional[int] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> List[Tuple[int, str]]:
         """Find entries in a slob dictionary with cancellation support."""
         results = []
         try:
             from .slob import find
             for i, item in enumerate(find(query, slob, match_prefix=True)):
                 # Check cancellation frequently
-                if request_id and request_id != self.current_request_id:
+                if self._is_cancelled(request_id, cancel_event):
                     logger.debug(f"Search cancelled during iteration (request {request_id})")
                     return []
 
@@ -227,6 +284,12 @@ class SlobClient:
 
         return None
 
+    def _is_cancelled(self, request_id: Optional[int], cancel_event: Optional[threading.Event]) -> bool:
+        """Check whether a search request has been superseded or cancelled."""
+        if cancel_event is not None and cancel_event.is_set():
+            return True
+        return bool(request_id and request_id != self.current_request_id)
+
     def cancel_request(self, request_id: int) -> None:
         """Cancel a search/lookup request."""
         self.current_request_id = request_id
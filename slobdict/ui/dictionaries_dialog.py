@@ -5,12 +5,37 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 
 from gi.repository import Gtk, Adw, Gio, GLib
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from gettext import ngettext
+from typing import Dict, Any, List, Optional
 import threading
 from ..backend.slob_client import SlobClient
+from ..constants import rootdir
 from ..utils.i18n import _
 
 
+@lru_cache(maxsize=256)
+def _format_count(item_count: int) -> str:
+    """Return the translated item count label of a dictionary."""
+    if item_count < 0:
+        return _("Items unknown")
+    return ngettext("%d item", "%d items", item_count) % item_count
+
+
+@Gtk.Template(resource_path=rootdir + "/ui/dictionary_row.ui")
+class DictionaryRow(Gtk.Box):
+    """Row showing a dictionary and its controls."""
+
+    __gtype_name__ = "DictionaryRow"
+
+    # Template child bindings
+    name_label: Gtk.Label = Gtk.Template.Child()
+    count_label: Gtk.Label = Gtk.Template.Child()
+    info_button: Gtk.Button = Gtk.Template.Child()
+    delete_button: Gtk.Button = Gtk.Template.Child()
+    enabled_switch: Gtk.Switch = Gtk.Template.Child()
+
+
 class DictionariesDialog(Adw.Window):
     """Dialog for managing dictionaries."""
 
@@ -24,6 +49,7 @@ class DictionariesDialog(Adw.Window):
         
         self.slob_client = slob_client
         self.dict_manager = slob_client.dict_manager
+        self._current_toast: Optional[Adw.Toast] = None  # Toast still on screen, if any
         
         # Main box
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
@@ -57,13 +83,6 @@ class DictionariesDialog(Adw.Window):
         self.list_box.set_selection_mode(Gtk.SelectionMode.NONE)
         scrolled.set_child(self.list_box)
         
-        # Empty state
-        self.empty_label = Gtk.Label()
-        self.empty_label.set_markup(_("<b>No dictionaries</b>\n\nClick \"+\" to import one."))
-        self.empty_label.set_justify(Gtk.Justification.CENTER)
-        self.empty_label.set_margin_top(40)
-        self.empty_label.set_selectable(False)
-        
         # Load dictionaries
         self._refresh_list()
 
@@ -79,10 +98,17 @@ class DictionariesDialog(Adw.Window):
         dictionaries = self.dict_manager.get_dictionaries()
         
         if not dictionaries:
+            # Empty state, built only when it is actually shown
+            empty_label = Gtk.Label()
+            empty_label.set_markup(_("<b>No dictionaries</b>\n\nClick \"+\" to import one."))
+            empty_label.set_justify(Gtk.Justification.CENTER)
+            empty_label.set_margin_top(40)
+            empty_label.set_selectable(False)
+
             empty_row = Gtk.ListBoxRow()
             empty_row.set_selectable(False)
             empty_row.set_activatable(False)
-            empty_row.set_child(self.empty_label)
+            empty_row.set_child(empty_label)
             self.list_box.append(empty_row)
         else:
             for dict_info in dictionaries:
@@ -91,68 +117,16 @@ class DictionariesDialog(Adw.Window):
 
     def _create_dict_row(self, dict_info: Dict[str, Any]) -> Gtk.Box:
         """Create a row for a dictionary."""
-        row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        row.set_margin_top(12)
-        row.set_margin_bottom(12)
-        row.set_margin_start(12)
-        row.set_margin_end(12)
-        
-        # Left side: name and info
-        left_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        
-        # Name
-        name_label = Gtk.Label(label=dict_info['label'])
-        name_label.set_css_classes(["heading"])
-        name_label.set_halign(Gtk.Align.START)
-        left_box.append(name_label)
-        
-        # Item count
-        from gettext import ngettext
-
-        item_count = dict_info.get('blob_count', -1)
-        count_text = ngettext("%d item", "%d items", item_count) % item_count if item_count >= 0 else _("Items unknown")
-        count_label = Gtk.Label(label=count_text)
-        count_label.set_css_classes(["dim-label", "caption"])
-        count_label.set_halign(Gtk.Align.START)
-        left_box.append(count_label)
-        
-        row.append(left_box)
-        row.set_hexpand(True)
-
-        # Spacer to push controls to the end
-        spacer = Gtk.Box()
-        spacer.set_hexpand(True)
-        row.append(spacer)
-        
-        # Right side: controls
-        controls_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        
-        # Info button
-        info_button = Gtk.Button()
-        info_button.set_icon_name("dialog-information-symbolic")
-        info_button.set_has_frame(False)
-        info_button.add_css_class("lightbulb-button")
-        info_button.connect("clicked", self._on_info_clicked, dict_info)
-        controls_box.append(info_button)
-
-        # Delete button
-        delete_button = Gtk.Button()
-        delete_button.set_icon_name("edit-delete-symbolic")
-        delete_button.set_has_frame(False)
-        delete_button.add_css_class("delete-button")
-        delete_button.connect("clicked", self._on_delete_clicked, dict_info['filename'])
-        controls_box.append(delete_button)
+        row = DictionaryRow()
+        row.name_label.set_label(dict_info['label'])
+        row.count_label.set_label(_format_count(dict_info.get('blob_count', -1)))
         
-        # Enable/disable switch
-        enabled = dict_info.get('enabled', True)
-        switch = Gtk.Switch()
-        switch.set_active(enabled)
-        switch.set_halign(Gtk.Align.CENTER)
-        switch.set_valign(Gtk.Align.CENTER)
-        switch.connect("notify::active", self._on_switch_toggled, dict_info['filename'])
-        controls_box.append(switch)        
+        row.info_button.connect("clicked", self._on_info_clicked, dict_info)
+        row.delete_button.connect("clicked", self._on_delete_clicked, dict_info['filename'])
         
-        row.append(controls_box)
+        # Enable/disable switch
+        row.enabled_switch.set_active(dict_info.get('enabled', True))
+        row.enabled_switch.connect("notify::active", self._on_switch_toggled, dict_info['filename'])
         
         return row
 
@@ -163,6 +137,7 @@ class DictionariesDialog(Adw.Window):
             transient_for=self.get_root(),
             action=Gtk.FileChooserAction.OPEN,
         )
+        dialog.set_select_multiple(True)
         dialog.set_accept_label(_("Open"))
         dialog.set_cancel_label(_("Cancel"))
         
@@ -179,25 +154,32 @@ class DictionariesDialog(Adw.Window):
         
         def on_response(dialog, response) -> None:
             if response == Gtk.ResponseType.ACCEPT:
-                file = dialog.get_file()
-                if file:
-                    path = file.get_path()
+                from pathlib import Path
+                slob_paths: List[str] = []
+                other_paths: List[str] = []
+                files = dialog.get_files()
+                for i in range(files.get_n_items()):
+                    path = files.get_item(i).get_path()
+                    if not path:
+                        continue
                     # Check if file has .slob extension
-                    from pathlib import Path
-                    file_path = Path(path)
-                    
-                    if file_path.suffix.lower() == '.slob':
-                        # Direct import for SLOB files
-                        self._import_dictionary_with_format(path, source_format=None)
+                    if Path(path).suffix.lower() == '.slob':
+                        slob_paths.append(path)
                     else:
-                        # Show format selection for non-SLOB files
-                        self._show_format_selection_dialog(path)
+                        other_paths.append(path)
+
+                if slob_paths:
+                    # Direct import for SLOB files
+                    self._import_dictionaries(slob_paths, source_format=None)
+                if other_paths:
+                    # Show format selection for non-SLOB files
+                    self._show_format_selection_dialog(other_paths)
         
         dialog.connect("response", on_response)
         dialog.show()
 
-    def _show_format_selection_dialog(self, source_path: str) -> None:
-        """Show dialog to select the dictionary format."""
+    def _show_format_selection_dialog(self, source_paths: List[str]) -> None:
+        """Show dialog to select the dictionary format of the given files."""
         supported_formats = self.dict_manager.get_supported_formats()
         
         if not supported_formats:
@@ -288,13 +270,13 @@ class DictionariesDialog(Adw.Window):
                 selected_format = format_rows.get(selected_row)
             
             dialog.close()
-            self._import_dictionary_with_format(source_path, selected_format)
+            self._import_dictionaries(source_paths, selected_format)
         
         import_button.connect("clicked", on_import_clicked)
         dialog.present()
 
-    def _import_dictionary_with_format(self, source_path: str, source_format: Optional[str] = None) -> None:
-        """Import dictionary with specified format in background thread."""
+    def _import_dictionaries(self, source_paths: List[str], source_format: Optional[str] = None) -> None:
+        """Import dictionaries with specified format in background thread."""
         # Add spinner/progress indicator
         spinner = Gtk.Spinner()
         spinner.start()
@@ -335,41 +317,55 @@ class DictionariesDialog(Adw.Window):
                 
         def import_in_background() -> None:
             """Run import in background thread."""
-            error = None
-            result = None
-            
-            try:
-                result = self.dict_manager.import_dictionary(
-                    source_path=source_path,
-                    source_format=source_format
-                )
-            except FileNotFoundError as e:
-                error = _("Dictionary file not found")
-            except PermissionError as e:
-                error = _("Permission denied accessing dictionary")
-            except ValueError as e:
-                error = _("Invalid dictionary: %s") % str(e)
-            except RuntimeError as e:
-                error = _("Conversion failed: %s") % str(e)
-            except Exception as e:
-                error = _("Error importing dictionary: %s") % str(e)
+            from pathlib import Path
+            errors: List[str] = []
+            imported = 0
+
+            for source_path in source_paths:
+                error = None
+                try:
+                    if self.dict_manager.import_dictionary(
+                        source_path=source_path,
+                        source_format=source_format
+                    ):
+                        imported += 1
+                    else:
+                        error = _("Failed to import dictionary")
+                except FileNotFoundError as e:
+                    error = _("Dictionary file not found")
+                except PermissionError as e:
+                    error = _("Permission denied accessing dictionary")
+                except ValueError as e:
+                    error = _("Invalid dictionary: %s") % str(e)
+                except RuntimeError as e:
+                    error = _("Conversion failed: %s") % str(e)
+                except Exception as e:
+                    error = _("Error importing dictionary: %s") % str(e)
+
+                if error:
+                    errors.append(error if len(source_paths) == 1 else f"{Path(source_path).name}: {error}")
             
             # Schedule UI update on main thread
-            GLib.idle_add(lambda: self._on_import_complete(result, error, progress_window))
+            GLib.idle_add(lambda: self._on_import_complete(imported, errors, progress_window))
         
         # Start background thread
         thread = threading.Thread(target=import_in_background, daemon=True)
         thread.start()
 
-    def _on_import_complete(self, result, error, progress_window) -> bool:
+    def _on_import_complete(self, imported: int, errors: List[str], progress_window) -> bool:
         """Handle import completion on main thread."""
         progress_window.close()
         
-        if error:
-            self._show_error(error)
-        elif result:
+        # Refresh once for the whole batch
+        if imported:
             self._refresh_list()
+        
+        if errors:
+            self._show_error("\n".join(errors))
+        elif imported == 1:
             self._show_notification(_("Dictionary imported successfully"))
+        elif imported:
+            self._show_notification(ngettext("%d dictionary imported successfully", "%d dictionaries imported successfully", imported) % imported)
         else:
             self._show_error(_("Failed to import dictionary"))
         
@@ -423,7 +419,7 @@ class DictionariesDialog(Adw.Window):
         
         def on_response(dialog, response):
             if response == "delete":
-                if self.slob_client.delete_dictionary(filename):
+                if self.slob_client.delete_dictionaries([filename]):
                     self._refresh_list()
                     self._show_notification(_("Dictionary deleted"))
                 else:
@@ -436,9 +432,21 @@ class DictionariesDialog(Adw.Window):
         """Show a toast notification."""
         parent = self.get_root()
         if isinstance(parent, Adw.ApplicationWindow):
+            # Replace the visible toast instead of queueing another one, so
+            # the new message gets its full timeout
+            if self._current_toast is not None:
+                self._current_toast.dismiss()
+
             toast = Adw.Toast(title=message)
+            toast.connect("dismissed", self._on_toast_dismissed)
+            self._current_toast = toast
             parent.add_toast(toast)
 
+    def _on_toast_dismissed(self, toast: Adw.Toast) -> None:
+        """Forget the toast once it leaves the screen."""
+        if self._current_toast is toast:
+            self._current_toast = None
+
     def _show_error(self, message: str) -> None:
         """Show an error dialog."""
         dialog = Adw.MessageDialog(transient_for=self.get_root())
@@ -4,25 +4,35 @@ import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 gi.require_version("WebKit", "6.0")
+import json
 import logging
+import os
+import threading
 
-from gi.repository import Gtk, Adw, WebKit, Gio, GLib, Gdk
-from pathlib import Path
-from typing import List, Dict, Optional
+from collections import deque
+from gi.repository import Gtk, Adw, WebKit, Gio, GLib, GObject, Pango
+from itertools import islice
+from typing import Callable, Deque, Iterable, Iterator, List, Dict, Optional, Sequence, Set, Tuple, Union
 from concurrent.futures import ThreadPoolExecutor, Future
-from urllib.parse import quote, urlparse
+from urllib.parse import quote
 from ..backend.slob_client import SlobClient
 from ..backend.http_server import HTTPServer_
 from ..backend.bookmarks_db import BookmarksDB
 from ..backend.history_db import HistoryDB
 from ..backend.settings_manager import SettingsManager
 from ..constants import app_label, rootdir
-from ..utils.structs import DictEntry
+from ..utils.structs import DictEntry, LRUCache
 from ..utils.i18n import _
+from ..utils.utils import get_init_html, load_dark_mode_css
 
 
 logger = logging.getLogger(__name__)
 
+# Entries listed with their date in the history and bookmarks views
+DatedEntry = Union[HistoryDB.HistoryEntry, BookmarksDB.BookmarkEntry]
+# Fetches the page of dated entries following a page key, or the first one
+DatedFetcher = Callable[[Optional[Tuple[str, Optional[int]]]], Sequence[DatedEntry]]
+
 
 @Gtk.Template(resource_path=rootdir + "/ui/window.ui")
 class MainWindow(Adw.ApplicationWindow):
@@ -55,11 +65,12 @@ class MainWindow(Adw.ApplicationWindow):
             return self.term
 
     class NavigationHistory:
-        history: List[DictEntry] = []
-        current_index: int = 0
+        # Oldest entries are dropped beyond this many
+        MAX_ENTRIES = 200
 
         def __init__(self) -> None:
-            pass
+            self.history: Deque[DictEntry] = deque(maxlen=self.MAX_ENTRIES)
+            self.current_index: int = 0
 
         def has_next(self) -> bool:
             return self.current_index < len(self.history) - 1
@@ -81,13 +92,45 @@ class MainWindow(Adw.ApplicationWindow):
 
         def add(self, entry: DictEntry) -> None:
             # Remove any forward history if we're adding a new entry
-            if self.has_next():
-                self.history = self.history[:self.current_index + 1]
+            while self.has_next():
+                self.history.pop()
             
             self.history.append(entry)
             self.current_index = len(self.history) - 1
 
 
+    class ResultItem(GObject.Object):
+        """Item of the results list model."""
+
+        __gtype_name__ = "SlobDictResultItem"
+
+        def __init__(self, entry: DictEntry, date: Optional[str] = None):
+            super().__init__()
+            self.entry = entry
+            self.date = date
+
+
+    # Maximum number of lookup results
+    SEARCH_LIMIT = 150
+    # Typing pause before searching the dictionaries, in milliseconds
+    SEARCH_DEBOUNCE_MS = 120
+    # Typing pause before filtering history or bookmarks; these are local queries
+    HISTORY_SEARCH_DEBOUNCE_MS = 60
+    # Number of history or bookmark entries fetched at a time
+    DATED_PAGE_SIZE = 100
+    # Number of results added to the list per main loop iteration
+    RESULTS_CHUNK_SIZE = 50
+    # Number of list items kept for reuse across repopulations
+    RESULT_ITEM_CACHE_SIZE = 256
+    # Number of entries below the selected one read ahead while idle
+    PREFETCH_COUNT = 2
+    # Isolated script world holding the helpers called from Python
+    SCRIPT_WORLD = "slobdict"
+    # Identifier of the remote content blocker in the content filter store
+    CONTENT_FILTER_ID = "block-remote-content"
+    # Sidebar menu model shared by all windows
+    _menu_model: Optional[Gio.Menu] = None
+
     __gtype_name__ = "MainWindow"
 
     # Template child bindings
@@ -103,7 +146,10 @@ class MainWindow(Adw.ApplicationWindow):
     nav_buttons_box: Gtk.Box = Gtk.Template.Child()
     search_entry: Gtk.SearchEntry = Gtk.Template.Child()
     history_search_entry: Gtk.SearchEntry = Gtk.Template.Child()
-    results_list: Gtk.ListBox = Gtk.Template.Child()
+    results_stack: Gtk.Stack = Gtk.Template.Child()
+    results_scroll: Gtk.ScrolledWindow = Gtk.Template.Child()
+    results_list: Gtk.ListView = Gtk.Template.Child()
+    results_empty_label: Gtk.Label = Gtk.Template.Child()
     webview_container: Gtk.Box = Gtk.Template.Child()
     find_bar: Gtk.Box = Gtk.Template.Child()
     find_entry: Gtk.SearchEntry = Gtk.Template.Child()
@@ -117,34 +163,53 @@ class MainWindow(Adw.ApplicationWindow):
         self.settings_manager = settings_manager
         self.slob_client = slob_client
 
-        # Load custom CSS
-        css_provider = Gtk.CssProvider()
-        css_file = Path(__file__).parent / "style.css"
-        css_provider.load_from_path(str(css_file))
-        Gtk.StyleContext.add_provider_for_display(
-            Gdk.Display.get_default(),
-            css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
-
         # State
         self.current_view = "lookup"
+        self._sidebar_titles: Dict[str, str] = {
+            "lookup": _("Lookup"),
+            "bookmarks": _("Bookmarks"),
+            "history": _("History"),
+        }
         self.search_query = ""
-        self.row_to_result: Dict[Gtk.ListBoxRow, DictEntry] = {}
         self.navigation_history = MainWindow.NavigationHistory()
         self.current_entry: Optional[DictEntry] = None  # Track current entry being displayed
-        self.current_style: Optional[str] = None  # Stylesheet tracking
+        self._webview_created: bool = False  # Set once the webview was attempted
+        self.current_style: Optional[WebKit.UserStyleSheet] = None  # Stylesheet tracking
+        self._dark_styles: Dict[str, WebKit.UserStyleSheet] = {}  # Keyed by their CSS
         self.zoom_level = self.settings_manager.zoom_level
         self.load_remote = self.settings_manager.load_remote_content
         self.remote_reload_pending: bool = False    # Tracks if reload is in progress
+        self.remote_filter: Optional[WebKit.UserContentFilter] = None  # Blocks remote resources
 
         # Track pending tasks for cancellation
         self.pending_search_task: Optional[Future] = None
-        self.pending_lookup_task: Optional[Future] = None
+        self.pending_history_task: Optional[Future] = None
+        self.pending_prefetch_task: Optional[Future] = None
         self.request_counter = 0
         self.current_search_request_id: Optional[int] = None
+        self._search_cancel: Optional[threading.Event] = None
+        self._populate_generation = 0  # Invalidates chunked list population
+        # Fetches the next page of history or bookmarks, and where it starts
+        self._next_page: Optional[Tuple[DatedFetcher, Tuple[str, Optional[int]]]] = None
+        self._shown_results: Sequence[DictEntry] = ()  # Lookup results in the list
+        # Positions of the shown lookup results, by entry and by term
+        self._result_positions: Dict[Tuple[str, int, str], int] = {}
+        self._term_positions: Dict[str, int] = {}
+        self._result_item_cache: LRUCache[Tuple[str, int, str, Optional[str]], MainWindow.ResultItem] = LRUCache(
+            self.RESULT_ITEM_CACHE_SIZE
+        )
         self.scheduled_selected_lookup_item: Optional[MainWindow.LookupEntry] = None
         self.scheduled_select_first_lookup_item: bool = False
+        # Pending debounce timeouts for the search entries
+        self._search_debounce_id: int = 0
+        self._history_search_debounce_id: int = 0
+        # Pending timeout coalescing dark mode setting changes
+        self._dark_mode_pending_id: int = 0
+        # URI to load once the header updates are painted
+        self._pending_uri: Optional[str] = None
+        self._pending_uri_id: int = 0
+        # Pending idle callback reading ahead the entries after the selection
+        self._prefetch_id: int = 0
 
         # Initialize DB
         self.bookmarks_db = BookmarksDB()
@@ -155,10 +220,18 @@ class MainWindow(Adw.ApplicationWindow):
         self.http_server.start()
         # Store the actual port
         self.http_port: Optional[int] = self.http_server.get_port()
+        self._base_url = f"http://127.0.0.1:{self.http_port}/slob"
+        # URI prefixes allowed while remote content is blocked
+        self._local_uri_prefixes = (f"http://127.0.0.1:{self.http_port}/", "data:", "about:")
         self.connect("close-request", self._on_close)
 
-        # Thread pool executor for background tasks
-        self.executor = ThreadPoolExecutor(max_workers=2)
+        # One worker per queue: a newer task cancels the queued one, so only
+        # the latest search runs. Database writes have their own queue so
+        # they never hold up a search, and speculative entry reads have
+        # theirs so they never hold up database reads and writes.
+        self.search_executor = ThreadPoolExecutor(max_workers=1)
+        self.io_executor = ThreadPoolExecutor(max_workers=1)
+        self.prefetch_executor = ThreadPoolExecutor(max_workers=1)
 
         # Setup UI elements
         self._setup_ui()
@@ -179,10 +252,27 @@ class MainWindow(Adw.ApplicationWindow):
         """Setup UI elements from template."""
         # Connect search signals
         self.search_entry.connect("search-changed", self._on_search_changed)
+        self.search_entry.connect("activate", self._on_search_activate)
         self.history_search_entry.connect("search-changed", self._on_history_search_changed)
 
-        # Connect results list
-        self.results_list.connect("row-selected", self._on_result_selected)
+        # Connect results list: rows are recycled, only the model changes
+        self.results_store = Gio.ListStore.new(MainWindow.ResultItem)
+        self.results_selection = Gtk.SingleSelection(
+            model=self.results_store,
+            autoselect=False,
+            can_unselect=True
+        )
+        self._result_selected_handler_id = self.results_selection.connect(
+            "notify::selected-item", self._on_result_selected
+        )
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_result_item_setup)
+        factory.connect("bind", self._on_result_item_bind)
+
+        self.results_list.set_model(self.results_selection)
+        self.results_list.set_factory(factory)
+        self.results_scroll.connect("edge-reached", self._on_results_edge_reached)
 
         # Connect find bar signal
         self.find_entry.connect("search-changed", self._on_find_text_changed)
@@ -194,33 +284,16 @@ class MainWindow(Adw.ApplicationWindow):
         # Hide find bar by default
         self.find_bar.set_visible(False)
 
-        # Create and add webview
-        try:
-            self.manager = WebKit.UserContentManager()
-            self.webview = WebKit.WebView(user_content_manager=self.manager)
-
-            self.find_controller = self.webview.get_find_controller()
-            self.find_controller.connect("found-text", self._on_found_text)
-            self.find_controller.connect("failed-to-find-text", self._on_failed_to_find_text)
-
-            self._apply_webview_settings()
-
-            scrolled = Gtk.ScrolledWindow()
-            scrolled.set_child(self.webview)
-            scrolled.set_hexpand(True)
-            scrolled.set_vexpand(True)
-            
-            self.webview_container.append(scrolled)
-        except Exception as e:
-            label = Gtk.Label(label=_("WebKit unavailable: %s") % str(e))
-            label.set_hexpand(True)
-            label.set_vexpand(True)
-            self.webview_container.append(label)
+        # WebKit is slow to start; create the webview once the window is shown
+        GLib.idle_add(self._create_webview_idle)
 
     def _setup_menu(self) -> None:
         """Setup application menu."""
         if self.sidebar_menu_button:
-            self.sidebar_menu_button.set_menu_model(self._create_menu_model())
+            # The menu only refers to app actions, so all windows can share it
+            if MainWindow._menu_model is None:
+                MainWindow._menu_model = self._create_menu_model()
+            self.sidebar_menu_button.set_menu_model(MainWindow._menu_model)
 
 
     def _create_menu_model(self) -> Gio.Menu:
@@ -270,17 +343,64 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _update_sidebar_title(self) -> None:
         """Update sidebar title based on current view."""
+        title = self._sidebar_titles[self.current_view]
         title_widget: Adw.WindowTitle = self.sidebar_header.get_title_widget()
-        if self.current_view == "lookup":
-            title_widget.set_title(_("Lookup"))
-        elif self.current_view == "bookmarks":
-            title_widget.set_title(_("Bookmarks"))
-        else:
-            title_widget.set_title(_("History"))
+        if title_widget.get_title() != title:
+            title_widget.set_title(title)
+
+    def _create_webview_idle(self) -> bool:
+        """Create the webview after the first frame of the window."""
+        self._ensure_webview()
+        return False
+
+    def _ensure_webview(self) -> bool:
+        """Create and add the webview if not done yet; returns whether it is available."""
+        if self._webview_created:
+            return hasattr(self, 'webview')
+        self._webview_created = True
+
+        try:
+            self.manager = WebKit.UserContentManager()
+            self.manager.add_script(WebKit.UserScript.new_for_world(
+                "function getSelectedText() { return window.getSelection().toString(); }",
+                WebKit.UserContentInjectedFrames.TOP_FRAME,
+                WebKit.UserScriptInjectionTime.START,
+                self.SCRIPT_WORLD,
+                None,
+                None
+            ))
+            self.webview = WebKit.WebView(user_content_manager=self.manager)
+
+            # Context menu actions, reused by every context menu
+            self.lookup_action = Gio.SimpleAction.new("lookup", None)
+            self.lookup_action.connect("activate", self._on_lookup_selected)
+            self.open_link_action = Gio.SimpleAction.new("open-link", None)
+
+            self.find_controller = self.webview.get_find_controller()
+            self.find_controller.connect("found-text", self._on_found_text)
+            self.find_controller.connect("failed-to-find-text", self._on_failed_to_find_text)
+
+            self._apply_webview_settings()
+
+            scrolled = Gtk.ScrolledWindow()
+            scrolled.set_child(self.webview)
+            scrolled.set_hexpand(True)
+            scrolled.set_vexpand(True)
+            
+            self.webview_container.append(scrolled)
+        except Exception as e:
+            label = Gtk.Label(label=_("WebKit unavailable: %s") % str(e))
+            label.set_hexpand(True)
+            label.set_vexpand(True)
+            self.webview_container.append(label)
+
+        return hasattr(self, 'webview')
 
     def _apply_webview_settings(self) -> None:
         """Apply user preferences to WebView."""
         settings: WebKit.Settings = self.webview.get_settings()
+        # Kept for later preference changes
+        self.webview_settings = settings
 
         # Apply zoom level
         self.webview.set_zoom_level(self.zoom_level)
@@ -289,35 +409,138 @@ class MainWindow(Adw.ApplicationWindow):
         force_dark: bool = self.settings_manager.force_dark
         self._apply_dark_mode_css(force_dark)
 
-        from ..utils.utils import get_init_html
         self.webview.load_html(get_init_html(force_dark))
         
         # Enable/disable JavaScript
         enable_js: bool = self.settings_manager.enable_javascript
-        settings.set_property("enable-javascript", enable_js)
+        settings.set_enable_javascript(enable_js)
 
-        self.webview.connect("resource-load-started", self._on_resource_load_started)
+        self._setup_content_filter()
         self.webview.connect("load-changed", self._on_load_changed)
         self.webview.connect("context-menu", self._on_context_menu)
 
+    def _setup_content_filter(self) -> None:
+        """Install a WebKit content blocker that keeps remote resources out.
+
+        Blocking in WebKit itself avoids a Python callback for every
+        sub-resource of every page. Resources are filtered in Python until
+        the blocker is installed.
+        """
+        self._resource_handler_id = self.webview.connect(
+            "resource-load-started", self._on_resource_load_started
+        )
+        rules = [
+            {"trigger": {"url-filter": ".*"}, "action": {"type": "block"}},
+            {"trigger": {"url-filter": rf"^http://127\.0\.0\.1:{self.http_port}/"}, "action": {"type": "ignore-previous-rules"}},
+            {"trigger": {"url-filter": "^data:"}, "action": {"type": "ignore-previous-rules"}},
+            {"trigger": {"url-filter": "^about:"}, "action": {"type": "ignore-previous-rules"}},
+        ]
+        source = json.dumps(rules)
+        filters_dir = os.path.join(GLib.get_user_cache_dir(), "slobdict", "content-filters")
+        store = WebKit.UserContentFilterStore.new(filters_dir)
+        # The rules embed the port, so the stored filter is only reused while
+        # the rules it was compiled from, kept next to it, are the same
+        try:
+            with open(self._content_filter_source_path(filters_dir), encoding="utf-8") as f:
+                stored_source = f.read()
+        except OSError:
+            stored_source = None
+        if stored_source == source:
+            store.load(self.CONTENT_FILTER_ID, None, self._on_content_filter_loaded, source)
+        else:
+            self._compile_content_filter(store, source)
+
+    def _content_filter_source_path(self, filters_dir: str) -> str:
+        """Path of the rules the stored content blocker was compiled from."""
+        return os.path.join(filters_dir, f"{self.CONTENT_FILTER_ID}.json")
+
+    def _compile_content_filter(self, store: WebKit.UserContentFilterStore, source: str) -> None:
+        """Compile the content blocker, replacing the stored one."""
+        store.save(
+            self.CONTENT_FILTER_ID,
+            GLib.Bytes.new(source.encode("utf-8")),
+            None,
+            self._on_content_filter_saved,
+            source
+        )
+
+    def _on_content_filter_loaded(self,
+        store: WebKit.UserContentFilterStore,
+        result: Gio.AsyncResult,
+        source: str
+    ) -> None:
+        """Install the stored content blocker, or compile it if it is gone."""
+        try:
+            self._install_content_filter(store.load_finish(result))
+        except GLib.Error:
+            self._compile_content_filter(store, source)
+
+    def _on_content_filter_saved(self,
+        store: WebKit.UserContentFilterStore,
+        result: Gio.AsyncResult,
+        source: str
+    ) -> None:
+        """Install the compiled content blocker and remember its rules."""
+        try:
+            self._install_content_filter(store.save_finish(result))
+        except GLib.Error:
+            logger.exception("Failed to compile content filter, filtering resources in Python.")
+            return
+        try:
+            with open(self._content_filter_source_path(store.get_path()), "w", encoding="utf-8") as f:
+                f.write(source)
+        except OSError:
+            logger.warning("Failed to save content filter rules.", exc_info=True)
+
+    def _install_content_filter(self, content_filter: WebKit.UserContentFilter) -> None:
+        """Replace the Python resource filter with the content blocker."""
+        self.remote_filter = content_filter
+        self._update_content_filter()
+        self.webview.disconnect(self._resource_handler_id)
+
+    def _set_load_remote(self, load_remote: bool) -> None:
+        """Allow or block remote resources."""
+        self.load_remote = load_remote
+        self._update_content_filter()
+
+    def _update_content_filter(self) -> None:
+        """Enable the content blocker unless remote content is allowed."""
+        if not self.remote_filter:
+            return
+        self.manager.remove_filter(self.remote_filter)
+        if not self.load_remote:
+            self.manager.add_filter(self.remote_filter)
+
     def _apply_dark_mode_css(self, force_dark: bool) -> None:
         """Apply force-dark CSS when enabled"""
         if not hasattr(self, "manager"):
             return
 
+        style = self._get_dark_mode_style() if force_dark else None
+        if style is self.current_style:
+            return
+
         if self.current_style:
             self.manager.remove_style_sheet(self.current_style)
-
-        if force_dark:
-            from ..utils.utils import load_dark_mode_css
-            self.current_style = WebKit.UserStyleSheet(
-                load_dark_mode_css(),
+        if style:
+            self.manager.add_style_sheet(style)
+        self.current_style = style
+
+    def _get_dark_mode_style(self) -> WebKit.UserStyleSheet:
+        """Return the force-dark stylesheet, building it once per theme variant."""
+        # The CSS is cached per theme variant, so this is cheap
+        css = load_dark_mode_css()
+        style = self._dark_styles.get(css)
+        if style is None:
+            style = WebKit.UserStyleSheet(
+                css,
                 WebKit.UserContentInjectedFrames.ALL_FRAMES, 
                 WebKit.UserStyleLevel.USER, 
                 None, 
                 None
             )
-            self.manager.add_style_sheet(self.current_style)
+            self._dark_styles[css] = style
+        return style
 
     def _on_context_menu(self,
         webview: WebKit.WebView,
@@ -328,10 +551,8 @@ class MainWindow(Adw.ApplicationWindow):
         try:
             # Add Lookup option
             if hit_test_result.context_is_selection() and self.settings_manager.enable_javascript:
-                lookup_action = Gio.SimpleAction.new("lookup", None)
-                lookup_action.connect("activate", self._on_lookup_selected)
                 lookup_item = WebKit.ContextMenuItem.new_from_gaction(
-                    lookup_action,
+                    self.lookup_action,
                     _("Lookup"),
                     None
                 )
@@ -340,7 +561,7 @@ class MainWindow(Adw.ApplicationWindow):
             # Add Open Link option
             if hit_test_result.context_is_link():
                 open_link_item = WebKit.ContextMenuItem.new_from_gaction(
-                    Gio.SimpleAction.new("open-link", None),
+                    self.open_link_action,
                     _("Open Link"),
                     None
                 )
@@ -354,15 +575,15 @@ class MainWindow(Adw.ApplicationWindow):
     def _on_lookup_selected(self, action: Gio.SimpleAction, param: GLib.Variant) -> None:
         """Handle Lookup action from context menu."""
         try:
-            # Get currently selected text from WebView
-            # JavaScript to get selected text as a string
-            js_code = "window.getSelection().toString();"
+            # Get currently selected text from WebView through the helper
+            # injected at page load, so only a call has to be parsed here
+            js_code = "getSelectedText();"
             
             # In WebKit 6.0, evaluate_javascript is the standard
             self.webview.evaluate_javascript(
                 js_code, 
                 -1,      # Length of string (-1 for null-terminated)
-                None,    # World name (None for default)
+                self.SCRIPT_WORLD,  # Isolated world of the helper
                 None,    # Source URI
                 None,    # Cancellable
                 self._on_get_selection_for_lookup
@@ -383,30 +604,41 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _on_force_dark_changed(self, key: str, value: bool) -> None:
         """Handle force dark mode setting change."""
-        self._apply_dark_mode_css(value)
+        # Appearance and force dark often change together; apply them once
+        if self._dark_mode_pending_id:
+            GLib.source_remove(self._dark_mode_pending_id)
+        self._dark_mode_pending_id = GLib.timeout_add(100, self._apply_dark_mode_pending)
+
+    def _apply_dark_mode_pending(self) -> bool:
+        """Apply the current force dark mode setting to the webview."""
+        self._dark_mode_pending_id = 0
+        force_dark: bool = self.settings_manager.force_dark
+        self._apply_dark_mode_css(force_dark)
         if hasattr(self, 'webview'):
             if self.webview.get_uri() is None or self.webview.get_uri() == "about:blank":
-                from ..utils.utils import get_init_html
-                self.webview.load_html(get_init_html(value))
+                self.webview.load_html(get_init_html(force_dark))
+        return False
 
     def _on_javascript_changed(self, key: str, value: bool) -> None:
         """Handle JavaScript setting change."""
-        if hasattr(self, 'webview'):
-            settings: WebKit.Settings = self.webview.get_settings()
-            settings.set_property("enable-javascript", value)
+        if hasattr(self, 'webview_settings'):
+            self.webview_settings.set_enable_javascript(value)
 
     def _on_remote_content_changed(self, key: str, value: bool) -> None:
         """Handle remote content setting change."""
-        self.load_remote = value
+        self._set_load_remote(value)
 
     def _on_resource_load_started(self,
         webview: WebKit.WebView,
         resource: WebKit.WebResource,
         request: WebKit.URIRequest
     ) -> None:
+        """Block remote resources when the content filter is unavailable."""
+        if self.load_remote:
+            return
         uri = request.get_uri()
-        if not self.load_remote and uri and not (uri.startswith("http://127.0.0.1") or uri.startswith("data:") or uri.startswith("about:")):
-            logger.debug(f"Blocking remote resource: {uri}")
+        if uri and not uri.startswith(self._local_uri_prefixes):
+            logger.debug("Blocking remote resource: %s", uri)
             # Blocks remote resources by redirecting them
             request.set_uri("about:blank")
 
@@ -422,10 +654,12 @@ class MainWindow(Adw.ApplicationWindow):
         if event == WebKit.LoadEvent.FINISHED:
             # Page finished loading
             if self.remote_reload_pending:
-                self.load_remote = self.settings_manager.load_remote_content
+                self._set_load_remote(self.settings_manager.load_remote_content)
                 self.remote_reload_pending = False
 
     def on_dictionary_updated(self) -> None:
+        # Dictionary names may have changed
+        self._result_item_cache.clear()
         if hasattr(self, 'search_entry'):
             self._on_search_changed(self.search_entry)
         if hasattr(self, 'history_search_entry'):
@@ -441,11 +675,7 @@ class MainWindow(Adw.ApplicationWindow):
             entry = self.navigation_history.prev()
             if not entry:
                 return
-            GLib.idle_add(self._render_entry, entry, False)
-            self.current_entry = entry
-            self._update_bookmark_button()
-            self._update_content_subtitle(entry.term)
-            self._update_nav_buttons()
+            self._render_entry(entry, update_history=False)
 
     def _on_nav_forward(self, action: Gio.SimpleAction, param: GLib.Variant) -> None:
         """Navigate to next entry in navigation history."""
@@ -453,11 +683,7 @@ class MainWindow(Adw.ApplicationWindow):
             entry = self.navigation_history.next()
             if not entry:
                 return
-            GLib.idle_add(self._render_entry, entry, False)
-            self.current_entry = entry
-            self._update_bookmark_button()
-            self._update_content_subtitle(entry.term)
-            self._update_nav_buttons()
+            self._render_entry(entry, update_history=False)
 
     def _on_find(self, action: Gio.SimpleAction, param: GLib.Variant) -> None:
         """Open find bar for searching page content."""
@@ -470,15 +696,21 @@ class MainWindow(Adw.ApplicationWindow):
         if not entry:
             return
                 
+        # Update the button and the bookmark state right away, so toggling
+        # again before the write finishes sees it; write in the background
         if self.bookmarks_db.is_bookmarked(entry):
             # Remove bookmark
-            self.bookmarks_db.remove_bookmark(entry)
             self.bookmark_button.set_icon_name("non-starred-symbolic")
+            self.bookmarks_db.update_cached_key(entry, False)
+            future = self.io_executor.submit(self.bookmarks_db.remove_bookmark, entry)
         else:
             # Add bookmark
-            self.bookmarks_db.add_bookmark(entry)
             self.bookmark_button.set_icon_name("starred-symbolic")
-        self._on_history_search_changed(self.history_search_entry)
+            self.bookmarks_db.update_cached_key(entry, True)
+            future = self.io_executor.submit(self.bookmarks_db.add_bookmark, entry)
+        future.add_done_callback(
+            lambda f: GLib.idle_add(self._on_history_search_changed, self.history_search_entry)
+        )
 
     def _on_zoom_in(self, action: Gio.SimpleAction, param: GLib.Variant) -> None:
         """Increase zoom level by 10% up to 300%."""
@@ -505,10 +737,14 @@ class MainWindow(Adw.ApplicationWindow):
             print_operation.run_dialog(self)
     
     def _on_load_remote(self, action: Gio.SimpleAction, param: GLib.Variant) -> None:
-        if self.remote_reload_pending:
+        if self.remote_reload_pending or not hasattr(self, 'webview'):
+            return
+        # Nothing to reload if remote content is already allowed or no entry is
+        # shown; whether the page actually referenced remote content is not tracked
+        if self.load_remote or self.current_entry is None:
             return
         
-        self.load_remote = True
+        self._set_load_remote(True)
         self.remote_reload_pending = True
         self.webview.reload()
 
@@ -540,290 +776,463 @@ class MainWindow(Adw.ApplicationWindow):
             return
 
         text = search_entry.get_text()
-        
+
+        # Coalesce keystrokes: only the last text after a short pause is searched
+        if self._search_debounce_id:
+            GLib.source_remove(self._search_debounce_id)
+            self._search_debounce_id = 0
+
+        # Recently searched text is shown right away, without a worker round trip
+        cached = self.slob_client.get_cached_search(text, self.SEARCH_LIMIT) if text else None
+        if cached is not None:
+            self.request_counter += 1
+            self.current_search_request_id = self.request_counter
+            self._cancel_pending_search()
+            self._populate_results(cached, self.current_search_request_id)
+        elif text:
+            self._search_debounce_id = GLib.timeout_add(self.SEARCH_DEBOUNCE_MS, self._dispatch_search, text)
+        else:
+            # Increment request counter to invalidate previous request
+            self.request_counter += 1
+            self.current_search_request_id = self.request_counter
+            self._cancel_pending_search()
+            self._clear_results()
+
+    def _on_search_activate(self, search_entry: Gtk.SearchEntry) -> None:
+        """Search right away on Enter instead of waiting for the debounce."""
+        if self.current_view != "lookup" or not self._search_debounce_id:
+            return
+
+        GLib.source_remove(self._search_debounce_id)
+        self._dispatch_search(search_entry.get_text())
+
+    def _cancel_pending_search(self) -> None:
+        """Abort the search in flight, if any."""
+        if self._search_cancel:
+            self._search_cancel.set()
+            self._search_cancel = None
+        if self.pending_search_task:
+            self.pending_search_task.cancel()
+            self.pending_search_task = None
+
+    def _dispatch_search(self, text: str) -> bool:
+        """Submit the debounced search."""
+        self._search_debounce_id = 0
+        if self.current_view != "lookup":
+            return False
+
         # Increment request counter to invalidate previous request
         self.request_counter += 1
         self.current_search_request_id = self.request_counter
 
-        if text:
-            # Submit new search task
-            self.pending_search_task = self.executor.submit(
-                self._search_task, text, self.current_search_request_id
-            )
-        else:
-            self._populate_results([])
+        # Stop the previous search so the worker is free for this one
+        self._cancel_pending_search()
+        self._search_cancel = threading.Event()
+
+        # Submit new search task
+        self.pending_search_task = self.search_executor.submit(
+            self._search_task, text, self.current_search_request_id, self._search_cancel
+        )
+        return False
 
     def _on_history_search_changed(self, search_entry: Gtk.SearchEntry) -> None:
         """Handle history/bookmarks search text changes."""
         if self.current_view not in ("history", "bookmarks"):
             return
         
-        text = search_entry.get_text()
+        if self._history_search_debounce_id:
+            GLib.source_remove(self._history_search_debounce_id)
+        self._history_search_debounce_id = GLib.timeout_add(
+            self.HISTORY_SEARCH_DEBOUNCE_MS, self._dispatch_history_search, search_entry.get_text()
+        )
+
+    def _dispatch_history_search(self, text: str) -> bool:
+        """Populate history/bookmarks with the debounced filter."""
+        self._history_search_debounce_id = 0
         if self.current_view == "history":
             self._populate_history(text)
-        else:
+        elif self.current_view == "bookmarks":
             self._populate_bookmarks(text)
+        return False
 
-    def _search_task(self, query: str, request_id: int) -> None:
+    def _search_task(self, query: str, request_id: int, cancel_event: threading.Event) -> None:
         """Search task with cancellation support."""
-        # Mark this as current request in slob client
-        self.slob_client.set_current_request(request_id)
-        results = self.slob_client.search(query, limit=150, request_id=request_id)
+        # Superseded while waiting in the queue
+        if cancel_event.is_set() or request_id != self.current_search_request_id:
+            return
+
+        results = self.slob_client.search(query, limit=self.SEARCH_LIMIT, cancel_event=cancel_event)
         
         # Only update UI if this request is still current
-        if request_id == self.current_search_request_id:
-            GLib.idle_add(self._populate_results, results, request_id)
+        if not cancel_event.is_set() and request_id == self.current_search_request_id:
+            GLib.idle_add(self._populate_results, results, request_id, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+            # Speculatively read the top entry while the list is shown, so
+            # its storage bin is already decompressed if it gets opened. This
+            # runs on the prefetch worker to keep the search worker free.
+            if results:
+                self.prefetch_executor.submit(self._prefetch_task, results[:1], cancel_event)
     
-    def _populate_results(self, results: List[DictEntry], request_id: Optional[int] = None) -> None:
+    def _populate_results(self, results: List[DictEntry], request_id: Optional[int] = None) -> bool:
         """Populate results list."""
-        self.row_to_result.clear()
-
-        # Clear existing rows
-        while True:
-            row = self.results_list.get_first_child()
-            if row is None:
-                break
-            self.results_list.remove(row)
-
-        # Add new rows
-        for result in results:
-            row = Gtk.ListBoxRow()
-            box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-            box.set_margin_top(8)
-            box.set_margin_bottom(8)
-            box.set_margin_start(12)
-            box.set_margin_end(12)
-            box.set_spacing(4)
-
-            title_label = Gtk.Label(label=result.term)
-            title_label.set_ellipsize(3)  # Gtk.EllipsizeMode.END
-            title_label.set_halign(Gtk.Align.START)
-            box.append(title_label)
-
-            source_label = Gtk.Label(label=result.dict_name)
-            source_label.set_css_classes(["dim-label"])
-            source_label.set_ellipsize(3)  # Gtk.EllipsizeMode.END
-            source_label.set_halign(Gtk.Align.START)
-            box.append(source_label)
-
-            row.set_child(box)
-            
-            # Store result by row object directly
-            self.row_to_result[row] = result
-            
-            self.results_list.append(row)
+        # A newer search started after these results were queued
+        if request_id is not None and request_id != self.current_search_request_id:
+            return False
+
+        if results and self._shows_results(results):
+            # Same list as already shown, e.g. after a trailing space
+            self._shown_results = results
+            self._select_scheduled_result(request_id)
+            return False
+
+        self._set_result_items(
+            self._result_items((result, None) for result in results),
+            on_complete=lambda: self._select_scheduled_result(request_id),
+            shown_results=results
+        )
+        return False
+
+    def _shows_results(self, results: List[DictEntry]) -> bool:
+        """Whether the list fully shows these results, in this order."""
+        shown = self._shown_results
+        return (len(shown) == len(results) == self.results_store.get_n_items()
+            and all(a.dict_id == b.dict_id and a.term_id == b.term_id and a.term == b.term
+                for a, b in zip(shown, results)))
 
-        # Select an item if requested
+    def _select_scheduled_result(self, request_id: Optional[int]) -> None:
+        """Select an item if requested once all results are listed."""
         if request_id == self.current_search_request_id:
             if self.scheduled_selected_lookup_item:
-                logger.debug(f"Opening {self.scheduled_selected_lookup_item}")
+                logger.debug("Opening %s", self.scheduled_selected_lookup_item)
                 entry = self.scheduled_selected_lookup_item
                 self.scheduled_selected_lookup_item = None
                 self._activate_row_by_entry(entry, self.scheduled_select_first_lookup_item)
             elif self.scheduled_select_first_lookup_item:
                 self.scheduled_select_first_lookup_item = False
-                first_child = self.results_list.get_first_child()
-                if first_child:
-                    self.results_list.select_row(first_child)
+                if self.results_store.get_n_items() > 0:
+                    self.results_selection.set_selected(0)
 
     def _populate_bookmarks(self, filter_query: str = "") -> None:
         """Populate bookmarks list with optional filtering."""
-        bookmark_items = self.bookmarks_db.get_bookmarks(filter_query)
-        
-        self.row_to_result.clear()
-
-        # Clear existing rows
-        while True:
-            row = self.results_list.get_first_child()
-            if row is None:
-                break
-            self.results_list.remove(row)
-
-        if not bookmark_items:
-            row = Gtk.ListBoxRow()
-            row.set_selectable(False)
-            row.set_activatable(False)
-            
-            box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-            box.set_halign(Gtk.Align.CENTER)
-            box.set_valign(Gtk.Align.CENTER)
-            box.set_vexpand(True)
-            box.set_hexpand(True)
-            box.set_spacing(10)
-
-            label = Gtk.Label(label=_("No bookmarks"))
-            label.set_css_classes(["dim-label"])
-            label.set_wrap(True)
-            box.append(label)
-
-            row.set_child(box)
-            self.results_list.append(row)
-            return
-
-        # Add bookmark items
-        for bookmark_item in bookmark_items:
-            row = Gtk.ListBoxRow()
-            box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-            box.set_margin_top(8)
-            box.set_margin_bottom(8)
-            box.set_margin_start(12)
-            box.set_margin_end(12)
-            box.set_spacing(4)
-
-            # Title
-            title_label = Gtk.Label(label=bookmark_item.term)
-            title_label.set_ellipsize(3)
-            title_label.set_halign(Gtk.Align.START)
-            box.append(title_label)
-
-            # Source and date
-            info_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-            info_box.set_spacing(8)
-            
-            source_label = Gtk.Label(label=bookmark_item.dict_name)
-            source_label.set_css_classes(["dim-label"])
-            source_label.set_ellipsize(3)
-            source_label.set_halign(Gtk.Align.START)
-            info_box.append(source_label)
-
-            date_label = Gtk.Label(
-                label=bookmark_item.created_at_formatted()
-            )
-            date_label.set_css_classes(["dim-label"])
-            date_label.set_ellipsize(3)
-            date_label.set_halign(Gtk.Align.START)
-            date_label.set_hexpand(True)
-            info_box.append(date_label)
-            
-            box.append(info_box)
-
-            row.set_child(box)
-            self.row_to_result[row] = bookmark_item
-            self.results_list.append(row)
+        self._populate_dated(
+            lambda after: self.bookmarks_db.get_bookmarks(filter_query, self.DATED_PAGE_SIZE, after),
+            _("No bookmarks")
+        )
 
     def _populate_history(self, filter_query: str = "") -> None:
         """Populate history list with optional filtering."""
-        history_items = self.history_db.get_history(filter_query)
-        
-        self.row_to_result.clear()
-
-        # Clear existing rows
-        while True:
-            row = self.results_list.get_first_child()
-            if row is None:
-                break
-            self.results_list.remove(row)
-
-        if not history_items:
-            row = Gtk.ListBoxRow()
-            row.set_selectable(False)
-            row.set_activatable(False)
-            
-            box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-            box.set_halign(Gtk.Align.CENTER)
-            box.set_valign(Gtk.Align.CENTER)
-            box.set_vexpand(True)
-            box.set_hexpand(True)
-            box.set_spacing(10)
-
-            label = Gtk.Label(label=_("No history"))
-            label.set_css_classes(["dim-label"])
-            label.set_wrap(True)
-            box.append(label)
-
-            row.set_child(box)
-            self.results_list.append(row)
+        self._populate_dated(
+            lambda after: self.history_db.get_history(filter_query, self.DATED_PAGE_SIZE, after),
+            _("No history")
+        )
+
+    def _populate_dated(self,
+        fetch_page: DatedFetcher,
+        empty_message: str
+    ) -> None:
+        """
+        Populate results list with history or bookmark entries showing their date.
+
+        Only the first page is fetched, off the main thread; the next ones are
+        fetched once the list is scrolled to the bottom.
+        """
+        # Any later population of the list makes this one stale
+        self._populate_generation += 1
+        self._next_page = None
+        self.io_executor.submit(
+            self._fetch_dated_task, fetch_page, empty_message, self._populate_generation
+        )
+
+    def _fetch_dated_task(self,
+        fetch_page: DatedFetcher,
+        empty_message: str,
+        generation: int
+    ) -> None:
+        """Fetch the first page of history or bookmarks in the background."""
+        entries = fetch_page(None)
+        GLib.idle_add(self._show_dated, fetch_page, entries, empty_message, generation)
+
+    def _show_dated(self,
+        fetch_page: DatedFetcher,
+        entries: Sequence[DatedEntry],
+        empty_message: str,
+        generation: int
+    ) -> bool:
+        """Show the first page of history or bookmarks unless the list changed meanwhile."""
+        if generation != self._populate_generation:
+            return False
+
+        def on_complete() -> None:
+            if len(entries) == self.DATED_PAGE_SIZE:
+                self._next_page = (fetch_page, entries[-1].page_key)
+
+        self._set_result_items(
+            self._result_items((entry, entry.created_at_formatted()) for entry in entries),
+            empty_message,
+            on_complete
+        )
+        return False
+
+    def _on_results_edge_reached(self, scrolled: Gtk.ScrolledWindow, position: Gtk.PositionType) -> None:
+        """Append the next page of history or bookmarks at the end of the list."""
+        if position != Gtk.PositionType.BOTTOM or self._next_page is None:
             return
 
-        # Add history items
-        for history_item in history_items:
-            row = Gtk.ListBoxRow()
-            box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-            box.set_margin_top(8)
-            box.set_margin_bottom(8)
-            box.set_margin_start(12)
-            box.set_margin_end(12)
-            box.set_spacing(4)
-
-            # Title
-            title_label = Gtk.Label(label=history_item.term)
-            title_label.set_ellipsize(3)  # Gtk.EllipsizeMode.END
-            title_label.set_halign(Gtk.Align.START)
-            box.append(title_label)
-
-            # Source and date
-            info_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-            info_box.set_spacing(8)
-            
-            source_label = Gtk.Label(label=history_item.dict_name)
-            source_label.set_css_classes(["dim-label"])
-            source_label.set_ellipsize(3)  # Gtk.EllipsizeMode.END
-            source_label.set_halign(Gtk.Align.START)
-            info_box.append(source_label)
-
-            date_label = Gtk.Label(
-                label=history_item.created_at_formatted()
-            )
-            date_label.set_css_classes(["dim-label"])
-            date_label.set_ellipsize(3)  # Gtk.EllipsizeMode.END
-            date_label.set_halign(Gtk.Align.START)
-            date_label.set_hexpand(True)
-            info_box.append(date_label)
-            
-            box.append(info_box)
+        fetch_page, after = self._next_page
+        self._next_page = None
+        self.io_executor.submit(
+            self._fetch_next_page_task, fetch_page, after, self._populate_generation
+        )
+
+    def _fetch_next_page_task(self,
+        fetch_page: DatedFetcher,
+        after: Tuple[str, Optional[int]],
+        generation: int
+    ) -> None:
+        """Fetch the next page of history or bookmarks in the background."""
+        entries = fetch_page(after)
+        GLib.idle_add(self._append_dated, fetch_page, entries, generation)
+
+    def _append_dated(self,
+        fetch_page: DatedFetcher,
+        entries: Sequence[DatedEntry],
+        generation: int
+    ) -> bool:
+        """Append the next page of history or bookmarks unless the list changed meanwhile."""
+        if generation != self._populate_generation:
+            return False
+
+        self.results_store.splice(
+            self.results_store.get_n_items(),
+            0,
+            list(self._result_items((entry, entry.created_at_formatted()) for entry in entries))
+        )
+        if len(entries) == self.DATED_PAGE_SIZE:
+            self._next_page = (fetch_page, entries[-1].page_key)
+        return False
+
+    def _result_items(self,
+        entries: Iterable[Tuple[DictEntry, Optional[str]]]
+    ) -> Iterator["MainWindow.ResultItem"]:
+        """Yield list items for (entry, date) pairs, never the same item twice."""
+        listed: Set[int] = set()
+        for entry, date in entries:
+            item = self._get_result_item(entry, date)
+            if id(item) in listed:
+                # Same term twice, e.g. for two fragments of one blob
+                item = MainWindow.ResultItem(entry, date)
+            listed.add(id(item))
+            yield item
+
+    def _get_result_item(self, entry: DictEntry, date: Optional[str] = None) -> "MainWindow.ResultItem":
+        """Return a list item for the entry, reusing a recent one if possible."""
+        # Aliases share a blob id, so the term is part of the key
+        key = (entry.dict_id, entry.term_id, entry.term, date)
+        item = self._result_item_cache.get(key)
+        if item is None:
+            item = MainWindow.ResultItem(entry, date)
+            self._result_item_cache.put(key, item)
+        return item
+
+    def _set_result_items(self,
+        items: Iterable["MainWindow.ResultItem"],
+        empty_message: Optional[str] = None,
+        on_complete: Optional[Callable[[], None]] = None,
+        shown_results: Sequence[DictEntry] = ()
+    ) -> None:
+        """
+        Replace the contents of the results list.
+
+        The first chunk is shown right away, the rest is appended from idle
+        callbacks so that input events are handled in between.
+
+        Args:
+            shown_results: Lookup results behind the items, for selecting them by entry
+        """
+        self._populate_generation += 1
+        self._next_page = None
+        # Indexed before on_complete, which may run right away
+        self._set_shown_results(shown_results)
+        pending = iter(items)
+        first_chunk = list(islice(pending, self.RESULTS_CHUNK_SIZE))
+        # Replacing the items drops the selection; that is not a user selection
+        self.results_selection.handler_block(self._result_selected_handler_id)
+        try:
+            self.results_store.splice(0, self.results_store.get_n_items(), first_chunk)
+        finally:
+            self.results_selection.handler_unblock(self._result_selected_handler_id)
+
+        # Show a placeholder instead of an empty list if requested
+        if not first_chunk and empty_message:
+            self.results_empty_label.set_label(empty_message)
+            self.results_stack.set_visible_child_name("empty")
+        else:
+            self.results_stack.set_visible_child_name("results")
+
+        if len(first_chunk) == self.RESULTS_CHUNK_SIZE:
+            GLib.idle_add(self._append_result_chunk, pending, self._populate_generation, on_complete)
+        elif on_complete:
+            on_complete()
+
+    def _set_shown_results(self, results: Sequence[DictEntry]) -> None:
+        """Remember the shown lookup results and index their positions."""
+        self._shown_results = results
+        self._result_positions = {}
+        self._term_positions = {}
+        for position, result in enumerate(results):
+            self._result_positions.setdefault((result.dict_id, result.term_id, result.term), position)
+            self._term_positions.setdefault(result.term, position)
+
+    def _clear_results(self) -> None:
+        """Empty the results list in one go, dropping any pending chunks."""
+        self._populate_generation += 1
+        self._next_page = None
+        self._set_shown_results(())
+        self.results_selection.handler_block(self._result_selected_handler_id)
+        try:
+            self.results_store.remove_all()
+        finally:
+            self.results_selection.handler_unblock(self._result_selected_handler_id)
+        self.results_stack.set_visible_child_name("results")
+
+    def _append_result_chunk(self,
+        pending: Iterator["MainWindow.ResultItem"],
+        generation: int,
+        on_complete: Optional[Callable[[], None]]
+    ) -> bool:
+        """Append the next chunk of results unless a newer population started."""
+        if generation != self._populate_generation:
+            return False
+
+        chunk = list(islice(pending, self.RESULTS_CHUNK_SIZE))
+        if chunk:
+            self.results_store.splice(self.results_store.get_n_items(), 0, chunk)
+        if len(chunk) == self.RESULTS_CHUNK_SIZE:
+            return True
 
-            row.set_child(box)
-            self.row_to_result[row] = history_item
-            self.results_list.append(row)
+        if on_complete:
+            on_complete()
+        return False
+
+    def _on_result_item_setup(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        """Build the widgets of a results row once; they are recycled while scrolling."""
+        box = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL,
+            margin_top=8,
+            margin_bottom=8,
+            margin_start=12,
+            margin_end=12,
+            spacing=4
+        )
+
+        # Title
+        box.title_label = Gtk.Label(ellipsize=Pango.EllipsizeMode.END, halign=Gtk.Align.START)
+        box.append(box.title_label)
+
+        # Source and date, dimmed together
+        info_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8, css_classes=["dim-label"])
+
+        box.source_label = Gtk.Label(
+            ellipsize=Pango.EllipsizeMode.END,
+            halign=Gtk.Align.START
+        )
+        info_box.append(box.source_label)
+
+        box.date_label = Gtk.Label(
+            ellipsize=Pango.EllipsizeMode.END,
+            halign=Gtk.Align.START,
+            hexpand=True
+        )
+        info_box.append(box.date_label)
 
-    def _on_result_selected(self, listbox: Gtk.ListBox, row: Gtk.ListBoxRow) -> None:
+        box.append(info_box)
+        list_item.set_child(box)
+
+    def _on_result_item_bind(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        """Show an item in a recycled results row."""
+        item: MainWindow.ResultItem = list_item.get_item()
+        box = list_item.get_child()
+        box.title_label.set_label(item.entry.term)
+        box.source_label.set_label(item.entry.dict_name)
+        box.date_label.set_label(item.date or "")
+        box.date_label.set_visible(item.date is not None)
+
+    def _on_result_selected(self, selection: Gtk.SingleSelection, pspec: GObject.ParamSpec) -> None:
         """Handle result selection."""        
-        if row is None:
+        item: Optional[MainWindow.ResultItem] = selection.get_selected_item()
+        if item is None:
             return
 
-        # Get result directly from row object
-        result = self.row_to_result.get(row)
-        
-        if result:
-            # Cancel previous lookup
-            if self.pending_lookup_task:
-                self.pending_lookup_task.cancel()
-
-            self.pending_lookup_task = self.executor.submit(
-                self._load_entry_task,
-                result
-            )
+        # Loading the page is asynchronous already; only the history write
+        # needs a worker thread
+        self._render_entry(item.entry)
 
-    def _load_entry_task(self, entry: DictEntry) -> None:
-        """Load entry task with cancellation support."""
-        GLib.idle_add(self._render_entry, entry)
-        # Add to history
+        # Add to history, dropping the write for an entry that was only passed over
         if self.settings_manager.enable_history:
-            self.history_db.add_entry(entry)
+            if self.pending_history_task:
+                self.pending_history_task.cancel()
+            self.pending_history_task = self.io_executor.submit(self.history_db.add_entry, item.entry)
+
+        # Read ahead the following entries once the main loop is idle
+        if self._prefetch_id:
+            GLib.source_remove(self._prefetch_id)
+        self._prefetch_id = GLib.idle_add(self._prefetch_following, selection.get_selected(), priority=GLib.PRIORITY_LOW)
+
+    def _prefetch_following(self, position: int) -> bool:
+        """Warm the dictionary storage for the entries after the selected one."""
+        self._prefetch_id = 0
+        end = min(position + 1 + self.PREFETCH_COUNT, self.results_store.get_n_items())
+        entries = [self.results_store.get_item(i).entry for i in range(position + 1, end)]
+        # Only the neighbours of the latest selection are worth reading
+        if self.pending_prefetch_task:
+            self.pending_prefetch_task.cancel()
+        if entries:
+            self.pending_prefetch_task = self.prefetch_executor.submit(self._prefetch_task, entries)
+        return False
+
+    def _prefetch_task(self, entries: List[DictEntry], cancel_event: Optional[threading.Event] = None) -> None:
+        """Read entries so their storage bins are decompressed when opened."""
+        for entry in entries:
+            # The search these entries came from was superseded
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            self.slob_client.get_entry(entry.term, entry.term_id, entry.dict_id)
 
     def _render_entry(self, entry: DictEntry, update_history: bool = True) -> None:
         """Render entry in webview."""
-        if not hasattr(self, 'webview'):
+        if not self._ensure_webview():
             return
 
         key = quote(entry.term, safe='')
-        key_id = quote(str(entry.term_id), safe='')
         source = quote(entry.dict_id, safe='')
         
-        url = f"http://127.0.0.1:{self.http_port}/slob/{source}/{key}?blob={key_id}"
-        logger.debug(f"Loading: {url}")
+        # The blob id is an integer and never needs escaping
+        url = f"{self._base_url}/{source}/{key}?blob={entry.term_id:d}"
+        logger.debug("Loading: %s", url)
         
         # Update navigation history if this is a new entry (not from back/forward)
         if update_history:
             self.navigation_history.add(entry)
-            self._update_nav_buttons()
-        
-        # Update header bar subtitle with current key
-        self._update_content_subtitle(entry.term)
-        
+
+        # Update all header bar state for the entry in one place
         self.current_entry = entry
+        self._update_content_subtitle(entry.term)
         self._update_bookmark_button()
-        self.webview.load_uri(url)
+        self._update_nav_buttons()
+
+        # Load from an idle callback: the header is painted first, and
+        # entries skipped over in quick succession are never loaded
+        self._pending_uri = url
+        if not self._pending_uri_id:
+            self._pending_uri_id = GLib.idle_add(self._load_pending_uri, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _load_pending_uri(self) -> bool:
+        """Load the last entry URI requested by _render_entry."""
+        self._pending_uri_id = 0
+        if self._pending_uri:
+            self.webview.load_uri(self._pending_uri)
+            self._pending_uri = None
+        return False
 
     def _update_content_subtitle(self, subtitle: str) -> None:
         """Update content subtitle"""
@@ -832,6 +1241,10 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _on_close(self, window) -> bool:
         """Handle window close."""
+        self._cancel_pending_search()
+        self.search_executor.shutdown(wait=False, cancel_futures=True)
+        self.io_executor.shutdown(wait=False, cancel_futures=True)
+        self.prefetch_executor.shutdown(wait=False, cancel_futures=True)
         self.http_server.stop()
         self.slob_client.close() # FIXME: Move to app level
         self.settings_manager.zoom_level = self.zoom_level
@@ -844,7 +1257,7 @@ class MainWindow(Adw.ApplicationWindow):
         self.search_entry.set_visible(True)
         self.history_search_entry.set_visible(False)
         self.search_entry.grab_focus()
-        self._populate_results([])
+        self._clear_results()
         self.on_dictionary_updated()
 
     def action_bookmarks(self, action: Gio.SimpleAction, param: GLib.Variant) -> None:
@@ -885,61 +1298,38 @@ class MainWindow(Adw.ApplicationWindow):
         self.search_entry.set_text(search)
         self.search_entry.grab_focus()
 
-    def _activate_row_by_entry(self, entry: LookupEntry, select_first: bool = False) -> Gtk.ListBoxRow:
+    def _activate_row_by_entry(self, entry: LookupEntry, select_first: bool = False) -> Optional[int]:
         """
-        Find and activate Gtk.ListBoxRow by key or (source and key_id).
+        Find and select the result matching key or (source and key_id).
         
         Args:
-            key: Dictionary entry
-            key_id: Key identifier within dictionary
-            source: Dictionary identifier
+            entry: Entry to look for
+            select_first: Select the first result if the entry is not found
+
+        Returns:
+            Position of the selected result, if found
         """
-        if not hasattr(self, 'results_list'):
+        if not hasattr(self, 'results_store'):
             return None
                 
-        # Search through row_to_result mapping
-        target_row = None
+        # Look up the position in the index of the shown results
         if entry.term_id and entry.dict_id:
-            for row, result_data in self.row_to_result.items():
-                if (result_data.dict_id == entry.dict_id and
-                    result_data.term_id == entry.term_id):
-                    target_row = row
-                    break
+            target_position = self._result_positions.get((entry.dict_id, entry.term_id, entry.term))
         else:
-            for row, result_data in self.row_to_result.items():
-                if result_data.term == entry.term:
-                    target_row = row
-                    break
+            target_position = self._term_positions.get(entry.term)
         
-        if target_row:
-            # Select the row
-            self.results_list.select_row(target_row)
-            GLib.idle_add(self._scroll_to_row, target_row, priority=GLib.PRIORITY_DEFAULT_IDLE)
-            logger.debug(f"Activated: {entry}")
-            return target_row
+        if target_position is not None:
+            # Select the row and bring it into view
+            self.results_selection.set_selected(target_position)
+            self.results_list.scroll_to(target_position, Gtk.ListScrollFlags.FOCUS, None)
+            logger.debug("Activated: %s", entry)
+            return target_position
         elif select_first:
-            first_child = self.results_list.get_first_child()
-            if first_child:
-                    self.results_list.select_row(first_child)
+            if self.results_store.get_n_items() > 0:
+                self.results_selection.set_selected(0)
         
         return None
 
-    def _scroll_to_row(self, target_row: Gtk.ListBoxRow) -> None:
-        # Get the vertical adjustment from the ListBox or its parent ScrolledWindow
-        adj = self.results_list.get_adjustment()
-        # Get the row's position relative to the ListBox
-        coordinates = target_row.translate_coordinates(self.results_list, 0, 0)
-        if coordinates:
-            # Set the scroll value (e.g., center the row)
-            x, y = coordinates
-            row_height = target_row.get_allocated_height()
-            page_size = adj.get_page_size()
-            new_value = y - (page_size / 2) + (row_height / 2)
-            if row_height == 0 or page_size == 0 or new_value <= 0:
-                target_row.grab_focus()
-            else: adj.set_value(new_value)
-        else: target_row.grab_focus()
-
     def _on_find_text_changed(self, entry: Gtk.SearchEntry) -> None:
         """Search as user types."""
         text = entry.get_text()
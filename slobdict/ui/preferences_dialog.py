@@ -5,7 +5,9 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 import logging
 
-from gi.repository import Gtk, Adw
+from concurrent.futures import ThreadPoolExecutor
+from gi.repository import Gtk, Adw, GLib
+from typing import Callable
 from ..backend.settings_manager import SettingsManager
 from ..backend.history_db import HistoryDB
 from ..backend.bookmarks_db import BookmarksDB
@@ -28,6 +30,9 @@ class PreferencesDialog(Adw.PreferencesWindow):
         self.settings_manager = settings_manager
         self.history_db = HistoryDB()
         self.bookmarks_db = BookmarksDB()
+        # Clears the databases without blocking the dialog
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.connect("close-request", self._on_close)
         
         # Create preferences page
         page = Adw.PreferencesPage()
@@ -138,6 +143,11 @@ class PreferencesDialog(Adw.PreferencesWindow):
         self.javascript_row = javascript_row
         self.history_row = history_row
 
+    def _on_close(self, window) -> bool:
+        """Let a running clear finish, then release the worker thread."""
+        self.executor.shutdown(wait=False)
+        return False
+
     def _on_appearance_changed(self, combo_row, param) -> None:
         """Handle appearance selection change."""
         selected = combo_row.get_selected()
@@ -177,12 +187,11 @@ class PreferencesDialog(Adw.PreferencesWindow):
         
         def on_response(dialog, response) -> None:
             if response == "clear":
-                try:
-                    self.history_db.clear_history()
-                    self._show_notification(_("History cleared"))
-                except Exception as e:
-                    logger.exception(f"Error clearing history.")
-                    self._show_error(_("Failed to clear history"))
+                self._run_in_background(
+                    self.history_db.clear_history,
+                    _("History cleared"),
+                    _("Failed to clear history")
+                )
         
         dialog.connect("response", on_response)
         dialog.present()
@@ -199,12 +208,11 @@ class PreferencesDialog(Adw.PreferencesWindow):
         
         def on_response(dialog, response):
             if response == "clear":
-                try:
-                    self.bookmarks_db.clear_bookmarks()
-                    self._show_notification(_("Bookmarks cleared"))
-                except Exception as e:
-                    logger.exception(f"Error clearing bookmarks.")
-                    self._show_error(_("Failed to clear bookmarks"))
+                self._run_in_background(
+                    self.bookmarks_db.clear_bookmarks,
+                    _("Bookmarks cleared"),
+                    _("Failed to clear bookmarks")
+                )
         
         dialog.connect("response", on_response)
         dialog.present()
@@ -229,14 +237,27 @@ class PreferencesDialog(Adw.PreferencesWindow):
         dialog.connect("response", on_response)
         dialog.present()
 
+    def _run_in_background(self, task: Callable[[], None], done_message: str, error_message: str) -> None:
+        """Run a task on the worker thread and report its outcome from the main loop."""
+        def run() -> None:
+            try:
+                task()
+            except Exception:
+                logger.exception(f"Error running {task.__name__}.")
+                GLib.idle_add(self._show_error, error_message)
+            else:
+                GLib.idle_add(self._show_notification, done_message)
+
+        self.executor.submit(run)
+
     def _clear_webview_cache(self) -> bool:
         """Clear WebView cache."""
         try:
             from gi.repository import WebKit
             gi.require_version("WebKit", "6.0")
 
-            webview = WebKit.WebView()
-            manager = webview.get_network_session().get_website_data_manager()
+            # The session shared by the web views; the data is cleared asynchronously
+            manager = WebKit.NetworkSession.get_default().get_website_data_manager()
             data_types = WebKit.WebsiteDataTypes.DISK_CACHE | WebKit.WebsiteDataTypes.MEMORY_CACHE
             manager.clear(data_types, 0, None, None, None)
             return True
@@ -1,9 +1,17 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
-from typing import Any
+import threading
+
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Optional, TypeVar
 from ..backend.slob import Blob
 
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
 class DictEntry(object):
+    __slots__ = ("_dict_id", "_dict_name", "_term_id", "_term")
+
     def __init__(self, dict_id: str, dict_name: str, term_id: int, term: str):
         self._dict_id: str = dict_id
         self._dict_name: str = dict_name
@@ -31,6 +39,8 @@ class DictEntry(object):
 
 
 class DictEntryContent(DictEntry):
+    __slots__ = ("_content", "_content_type")
+
     def __init__(self,
         dict_id: str,
         dict_name: str,
@@ -50,3 +60,34 @@ class DictEntryContent(DictEntry):
     @property
     def content_type(self) -> str:
         return self._content_type
+
+
+class LRUCache(Generic[K, V]):
+    """Mapping that keeps only its most recently used items. Thread-safe."""
+    __slots__ = ("_maxsize", "_items", "_lock")
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._items: "OrderedDict[K, V]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            if len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -1,17 +1,42 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 import os
+import re
 import logging
 
+from datetime import datetime
+from functools import lru_cache
 from gi.repository import Adw, Gtk, Gdk
 from pathlib import Path
-from typing import Callable, Optional, Dict
+from typing import TYPE_CHECKING, Callable, Optional, Dict, Tuple
 from ..constants import app_id
 from .i18n import _
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
 
 logger = logging.getLogger(__name__)
 
+# Directory of the files bundled with this module
+_MODULE_DIR = Path(__file__).parent
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_TAG_RE = re.compile(r'<[^>]+>')
+# lxml rejects str input carrying an encoding declaration
+_XML_DECLARATION_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+# Placeholders of intro.html
+_INTRO_PLACEHOLDER_RE = re.compile(r'\.ROOT_CSS \{\}|\{SUBTITLE\}|\{HINT\}')
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_DECLARATION_RE = re.compile(r'([a-zA-Z-]+)\s*:\s*([^;]*)')
+_IMPORTANT_RE = re.compile(r'\s*!\s*important\s*$', re.I)
+# Any inline style attribute; entries without one need no transformation
+_STYLE_ATTR_RE = re.compile(r'\sstyle\s*=', re.I)
+# Inline style properties read by transform_css_to_semantic_html
+_SEMANTIC_CSS_PROPERTIES = frozenset({'display', 'font-weight', 'font-style', 'text-decoration'})
+# Opaque #rrggbb colours, inverted without going through Gdk.RGBA
+_HEX_COLOR_RE = re.compile(r'#([0-9a-fA-F]{6})')
+
 
 def is_dark_mode() -> bool:
     """Check if the app is in dark mode."""
@@ -23,52 +48,100 @@ def _apply_inversion_hue_rotate180deg(rgba: Gdk.RGBA) -> Gdk.RGBA:
     Replicates CSS `filter: invert(1) hue-rotate(180deg)` exactly (to match dark-mode.css).
     Uses the W3C spec linear matrix for hue-rotation.
     """
-    # CSS Invert(1)
-    # Flips the channels: 0.0 -> 1.0, 1.0 -> 0.0
-    r = 1.0 - rgba.red
-    g = 1.0 - rgba.green
-    b = 1.0 - rgba.blue
-
-    # CSS Hue-Rotate(180deg) Matrix
-    # These constants are derived from the W3C formula using:
+    res = Gdk.RGBA()
+    res.red, res.green, res.blue = _invert_hue_rotate180deg(rgba.red, rgba.green, rgba.blue)
+    res.alpha = rgba.alpha
+    return res
+
+def _invert_hue_rotate180deg(red: float, green: float, blue: float) -> Tuple[float, float, float]:
+    """Channel form of _apply_inversion_hue_rotate180deg, on values in [0, 1]."""
+    # CSS Invert(1) followed by the CSS Hue-Rotate(180deg) matrix, fused
+    # into one affine transform by substituting r = 1 - R (and so on):
+    #   r_new = -0.574 * (1 - R) + 1.430 * (1 - G) + 0.144 * (1 - B)
+    #         = 1.0 + 0.574 * R - 1.430 * G - 0.144 * B
+    # The matrix constants are derived from the W3C formula using:
     # cos(180) = -1.0, sin(180) = 0.0
     # Weights: Red=0.213, Green=0.715, Blue=0.072
-    
+    # Each row of the hue-rotate matrix sums to 1.0, hence the 1.0 offsets
+
     # Matrix Row 1
-    r_new = (r * -0.574) + (g *  1.430) + (b *  0.144)
+    r_new = 1.0 + (red *  0.574) - (green * 1.430) - (blue * 0.144)
     # Matrix Row 2
-    g_new = (r *  0.426) + (g *  0.430) + (b *  0.144)
+    g_new = 1.0 - (red *  0.426) - (green * 0.430) - (blue * 0.144)
     # Matrix Row 3
-    b_new = (r *  0.426) + (g *  1.430) + (b * -0.856)
+    b_new = 1.0 - (red *  0.426) - (green * 1.430) + (blue * 0.856)
 
     # CSS filters clamp values to the [0, 1] range after matrix transforms
-    res = Gdk.RGBA()
-    res.red   = max(0.0, min(1.0, r_new))
-    res.green = max(0.0, min(1.0, g_new))
-    res.blue  = max(0.0, min(1.0, b_new))
-    res.alpha = rgba.alpha
-    
-    return res
+    return (
+        max(0.0, min(1.0, r_new)),
+        max(0.0, min(1.0, g_new)),
+        max(0.0, min(1.0, b_new))
+    )
 
+def _format_hex_color(red: float, green: float, blue: float) -> str:
+    """Format channels in [0, 1] as #rrggbb, rounded like Gdk.RGBA.to_string()."""
+    return '#%02x%02x%02x' % (int(0.5 + red * 255), int(0.5 + green * 255), int(0.5 + blue * 255))
+
+@lru_cache(maxsize=64)
 def get_inverted_color_for_dark_mode(color_str: str) -> str:
     """Invert a color"""
+    match = _HEX_COLOR_RE.fullmatch(color_str)
+    if match:
+        value = int(match.group(1), 16)
+        return _format_hex_color(*_invert_hue_rotate180deg(
+            (value >> 16) / 255, ((value >> 8) & 0xff) / 255, (value & 0xff) / 255
+        ))
+
     rgba = Gdk.RGBA()
     if not rgba.parse(color_str):
         rgba.parse('#000000')
     
-    return str(_apply_inversion_hue_rotate180deg(rgba).to_string())
+    res = _apply_inversion_hue_rotate180deg(rgba)
+    if res.alpha < 1.0:
+        # Only the rgba() form keeps the transparency
+        return str(res.to_string())
+    return _format_hex_color(res.red, res.green, res.blue)
+
+@lru_cache(maxsize=None)
+def _read_bundled_file(name: str) -> str:
+    """Read a file shipped next to this module; contents never change at runtime."""
+    with open(_MODULE_DIR / name, 'r') as f:
+        return f.read()
+
+def _theme_key() -> Tuple[bool, bool, Adw.AccentColor]:
+    """Return what the theme colours depend on, to key the caches below."""
+    style_manager = Adw.StyleManager.get_default()
+    return (style_manager.get_dark(), style_manager.get_high_contrast(), style_manager.get_accent_color())
 
 def load_dark_mode_css() -> str:
     """Load dark mode CSS file."""
-    css_path = Path(__file__).parent / "dark-mode.css"
+    return _build_dark_mode_css(*_theme_key())
+
+@lru_cache(maxsize=8)
+def _build_dark_mode_css(dark: bool, high_contrast: bool, accent: Adw.AccentColor) -> str:
     try:
-        bg_color = get_inverted_color_for_dark_mode(get_theme_colors()['--color-bg'])
-        with open(css_path, 'r') as f:
-            return str(f.read()).replace('.ROOT_CSS {}', f':root {{ --color-bg-inverted: {bg_color}; }}')
+        bg_color = get_inverted_color_for_dark_mode(_lookup_theme_colors(dark, high_contrast, accent)['--color-bg'])
+        return _read_bundled_file("dark-mode.css").replace('.ROOT_CSS {}', f':root {{ --color-bg-inverted: {bg_color}; }}')
     except FileNotFoundError:
-        logger.exception(f"Dark mode CSS not found at {css_path}.")
+        logger.exception(f"Dark mode CSS not found at {_MODULE_DIR / 'dark-mode.css'}.")
         return ""
 
+@lru_cache(maxsize=4096)
+def format_timestamp(timestamp: str) -> str:
+    """Format an ISO or SQLite timestamp for display; lists repeat the same ones."""
+    try:
+        # Parse ISO format or SQLite format
+        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        try:
+            # Try SQLite format
+            dt = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
+            return dt.strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            return timestamp
+
+@lru_cache(maxsize=1)
 def get_config_dir() -> Path:
     """Use Flatpak sandbox directory when available."""    
     # Check if running in Flatpak
@@ -81,9 +154,12 @@ def get_config_dir() -> Path:
     return config_dir
 
 def get_init_html(force_dark: bool) -> str:
-    html_path = Path(__file__).parent / "intro.html"
-    theme_colors = get_theme_colors()
-    if is_dark_mode() and force_dark: # Force dark => color inversion
+    return _build_init_html(force_dark, *_theme_key())
+
+@lru_cache(maxsize=16)
+def _build_init_html(force_dark: bool, dark: bool, high_contrast: bool, accent: Adw.AccentColor) -> str:
+    theme_colors = _lookup_theme_colors(dark, high_contrast, accent)
+    if dark and force_dark: # Force dark => color inversion
         css_vars = '; '.join([f"{k}: {get_inverted_color_for_dark_mode(v)}" for k,v in theme_colors.items()])
     else:
         css_vars = '; '.join([f"{k}: {v}" for k,v in theme_colors.items()])
@@ -93,28 +169,36 @@ def get_init_html(force_dark: bool) -> str:
             '{SUBTITLE}': _('Start typing a word in the search field to see its definitions here.'),
             '{HINT}': _('Focus lookup field')
         }
-        with open(html_path, 'r') as f:
-            text = str(f.read())
-            for old, new in replacements.items():
-                text = text.replace(old, new)
-            return text
+        # One pass over the template; substituted text is not scanned again
+        return _INTRO_PLACEHOLDER_RE.sub(lambda m: replacements[m.group(0)], _read_bundled_file("intro.html"))
     except Exception:
-        logger.exception(f"intro.html not found at {html_path}.")
+        logger.exception(f"intro.html not found at {_MODULE_DIR / 'intro.html'}.")
         return f"<html><body><style>:root {{ {css_vars} }}</style></body></html>"
 
 def get_theme_colors() -> Dict[str, str]:
-    # Get realized style context
-    temp = Gtk.Window()
-    temp.realize()
-    style_context = temp.get_style_context()
-    temp.destroy()
+    # The colours only change with the theme variant and accent colour
+    return dict(_lookup_theme_colors(*_theme_key()))
+
+@lru_cache(maxsize=1)
+def _style_probe() -> Gtk.Widget:
+    """Widget whose style context resolves the display's named colours."""
+    # Named colours come from the display's style cascade, so the widget needs
+    # neither a toplevel nor a native surface
+    return Gtk.Label()
+
+@lru_cache(maxsize=8)
+def _lookup_theme_colors(dark: bool, high_contrast: bool, accent: Adw.AccentColor) -> Dict[str, str]:
+    style_context = _style_probe().get_style_context()
+    if not style_context.lookup_color('theme_fg_color')[0]:
+        # The probe does not see the theme: use a realized window instead
+        temp = Gtk.Window()
+        temp.realize()
+        style_context = temp.get_style_context()
+        temp.destroy()
     
     def get_color(name: str, fallback: str) -> str:
-        try:
-            color = style_context.lookup_color(name)[1]
-            return str(color.to_string())
-        except:
-            return fallback
+        found, color = style_context.lookup_color(name)
+        return str(color.to_string()) if found else fallback
     
     # Core GTK theme colors
     colors = {
@@ -150,28 +234,23 @@ def html_to_text(html_content: str) -> str:
     
     Removes tags, normalizes whitespace, preserves readability.
     """
+    if not html_content or html_content.isspace():
+        return ""
     try:
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html_content, 'html.parser')
+        import lxml.html
+        root = lxml.html.fromstring(_XML_DECLARATION_RE.sub('', html_content, count=1))
         
         # Remove unwanted elements (scripts, styles, navigation)
-        for element in soup(["script", "style", "nav", "footer", "header"]):
-            element.decompose()
-        
-        # Get all text content
-        text = soup.get_text(separator=' ', strip=True)
+        for element in root.xpath("//script | //style | //nav | //footer | //header"):
+            element.drop_tree()
         
-        # Clean up excessive whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk).strip()
-        
-        return text
-    except Exception as e:
-        logger.exception(f"HTML parsing error.")
+        # Join all text nodes, then clean up excessive whitespace
+        text = ' '.join(root.xpath("//text()"))
+        return _WHITESPACE_RE.sub(' ', text).strip()
+    except Exception:
+        logger.exception("HTML parsing error.")
         # Fallback: remove tags with regex
-        import re
-        return re.sub(r'<[^>]+>', '', html_content).strip()
+        return _TAG_RE.sub('', html_content).strip()
 
 def inline_stylesheets(
     html: str,
@@ -225,53 +304,91 @@ def inline_stylesheets(
         link.insert_before(style_tag)
         link.decompose()
 
+    if soup.find("style") is None:
+        # Nothing to inline: skip premailer's re-parse and cascade, only
+        # drop the classes like it would
+        for tag in soup.find_all(class_=True):
+            del tag["class"]
+        return str(soup)
+
     return str(transform(str(soup), remove_classes=True, allow_network=False))
 
+def _parse_inline_style(style_str: str) -> Dict[str, str]:
+    """
+    Read the semantic properties of a style attribute, lower-cased.
+
+    Like a browser, the last declaration wins unless an earlier one is !important.
+    """
+    props: Dict[str, str] = {}
+    important = set()
+    for match in _CSS_DECLARATION_RE.finditer(_CSS_COMMENT_RE.sub('', style_str)):
+        name = match.group(1).lower()
+        if name not in _SEMANTIC_CSS_PROPERTIES or name in important:
+            continue
+        value, is_important = _IMPORTANT_RE.subn('', match.group(2))
+        props[name] = value.strip().lower()
+        if is_important:
+            important.add(name)
+    return props
+
 def transform_css_to_semantic_html(html: str) -> str:
     """
     Transform elements based on their CSS property.
     """
-    from bs4 import BeautifulSoup
-    import cssutils
-    import logging
+    if not _STYLE_ATTR_RE.search(html):
+        return html
+    return str(_semantic_soup(html))
 
-    cssutils.log.setLevel(logging.CRITICAL)
+def _semantic_soup(html: str) -> "BeautifulSoup":
+    """Parse the HTML and transform its elements, see transform_css_to_semantic_html."""
+    from bs4 import BeautifulSoup
 
     soup = BeautifulSoup(html, "lxml")
-    
+
     # Structural tags that should not be turned into div/span
     protected_tags = {'table', 'tr', 'td', 'th', 'ul', 'ol', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
 
-    for elem in list(soup.find_all(True)):
-        style_str = elem.get("style", "")
-        if not style_str:
+    # Only elements with an inline style can change
+    for elem in soup.find_all(style=True):
+        style_str = elem.get("style")
+        if not isinstance(style_str, str) or not style_str:
             continue
             
-        style = cssutils.parseStyle(style_str)
+        style = _parse_inline_style(style_str)
         
         # 1. Handle Visibility (Highest Priority)
-        display = style.getPropertyValue("display").lower()
+        display = style.get("display", "")
         if display == "none":
             elem.decompose()
             continue
 
         # 2. Handle Semantic Styles (Apply to ALL tags, including protected ones)
+        # Wrappers from the innermost to the outermost
+        wrappers = []
+
         # Handle Bold
-        weight = style.getPropertyValue("font-weight").lower()
+        weight = style.get("font-weight", "")
         if weight in ('bold', 'bolder') or (weight.isdigit() and int(weight) >= 600):
-            elem.wrap(soup.new_tag("strong"))
+            wrappers.append(soup.new_tag("strong"))
 
         # Handle Italics
-        font_style = style.getPropertyValue("font-style").lower()
+        font_style = style.get("font-style", "")
         if font_style in ('italic', 'oblique'):
-            elem.wrap(soup.new_tag("em"))
+            wrappers.append(soup.new_tag("em"))
 
         # Handle Text Decoration (underline, line-through)
-        text_decoration = style.getPropertyValue("text-decoration").lower()
+        text_decoration = style.get("text-decoration", "")
         if "underline" in text_decoration:
-            elem.wrap(soup.new_tag("u"))
+            wrappers.append(soup.new_tag("u"))
         if "line-through" in text_decoration:
-            elem.wrap(soup.new_tag("s"))
+            wrappers.append(soup.new_tag("s"))
+
+        if wrappers:
+            # Nest the wrappers first, then move the element into them once
+            for inner, outer in zip(wrappers, wrappers[1:]):
+                outer.append(inner)
+            elem.replace_with(wrappers[-1])
+            wrappers[0].append(elem)
 
         # 3. Handle Display-based Renaming (Skip if tag is protected)
         if elem.name not in protected_tags:
@@ -280,11 +397,13 @@ def transform_css_to_semantic_html(html: str) -> str:
             elif display == "inline":
                 elem.name = "span"
 
-    return str(soup)
+    return soup
 
 def html_to_markdown(html_str: str) -> str:
     """
     Convert HTML to markdown
     """
-    from markdownify import markdownify as md
-    return md(transform_css_to_semantic_html(html_str))
+    from markdownify import MarkdownConverter
+    # Convert the transformed tree directly instead of serializing and re-parsing it
+    markdown: str = MarkdownConverter().convert_soup(_semantic_soup(html_str))
+    return markdown